@@ -5,14 +5,17 @@ import (
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
 )
 
 // InMemoryTransport is a lightweight simulation of the Limitless lifelogs API.
 // Only implements the /lifelogs endpoint sufficient for unit testing cache logic.
+// Safe for concurrent use, since hybrid gaps may be fetched in parallel.
 type InMemoryTransport struct {
 	lifelogs   []map[string]interface{}
 	RequestLog []RequestLogEntry
 	Verbose    bool
+	mu         sync.Mutex
 }
 
 // RequestLogEntry records a request made to the transport.
@@ -30,24 +33,37 @@ func NewInMemoryTransport(verbose bool) *InMemoryTransport {
 	}
 }
 
-// Seed adds one or more lifelog objects to the in-memory store.
+// Seed adds one or more lifelog objects to the in-memory store. A prebuilt
+// batch can be passed as Seed(logs...) and is appended under a single lock.
 func (t *InMemoryTransport) Seed(logs ...map[string]interface{}) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
 	t.lifelogs = append(t.lifelogs, logs...)
 }
 
 // RequestsMade returns the number of requests made to this transport.
 func (t *InMemoryTransport) RequestsMade() int {
+	t.mu.Lock()
+	defer t.mu.Unlock()
 	return len(t.RequestLog)
 }
 
-// Reset clears all stored logs and recorded requests.
+// Reset clears all stored logs and recorded requests in place, keeping the
+// backing arrays so a transport shared across tests is not reallocated.
 func (t *InMemoryTransport) Reset() {
-	t.lifelogs = make([]map[string]interface{}, 0)
-	t.RequestLog = make([]RequestLogEntry, 0)
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	clear(t.lifelogs)
+	t.lifelogs = t.lifelogs[:0]
+	clear(t.RequestLog)
+	t.RequestLog = t.RequestLog[:0]
 }
 
 // Request simulates a low-level Limitless API request (lifelogs only).
 func (t *InMemoryTransport) Request(endpoint string, params map[string]string) (map[string]interface{}, error) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
 	// Track the call for assertions in unit tests
 	t.RequestLog = append(t.RequestLog, RequestLogEntry{
 		Endpoint: endpoint,
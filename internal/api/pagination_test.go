@@ -8,13 +8,7 @@ func TestInMemoryTransportPagination(t *testing.T) {
 	transport := NewInMemoryTransport(false)
 
 	// Seed with test data
-	for i := 0; i < 10; i++ {
-		transport.Seed(map[string]interface{}{
-			"id":        i,
-			"date":      "2024-07-15",
-			"startTime": "2024-07-15T10:00:00Z",
-		})
-	}
+	transport.Seed(sameDayLogs(10)...)
 
 	// Test that we can retrieve all items through pagination
 	// The InMemoryTransport uses limit=3 by default
@@ -42,13 +36,7 @@ func TestInMemoryTransportMaxResults(t *testing.T) {
 	transport := NewInMemoryTransport(false)
 
 	// Seed with test data
-	for i := 0; i < 10; i++ {
-		transport.Seed(map[string]interface{}{
-			"id":        i,
-			"date":      "2024-07-15",
-			"startTime": "2024-07-15T10:00:00Z",
-		})
-	}
+	transport.Seed(sameDayLogs(10)...)
 
 	api := NewLimitlessAPI(transport)
 
@@ -224,3 +212,32 @@ func TestMockTransport(t *testing.T) {
 	}
 }
 
+func TestInMemoryTransportReset(t *testing.T) {
+	transport := NewInMemoryTransport(false)
+	transport.Seed(map[string]interface{}{"id": 1, "date": "2024-07-14"})
+	transport.Request("lifelogs", map[string]string{"date": "2024-07-14"})
+
+	transport.Reset()
+
+	if transport.RequestsMade() != 0 {
+		t.Errorf("Expected request log to be cleared, got %d", transport.RequestsMade())
+	}
+	resp, _ := transport.Request("lifelogs", map[string]string{"date": "2024-07-14"})
+	data := resp["data"].(map[string]interface{})
+	if logs := data["lifelogs"].([]interface{}); len(logs) != 0 {
+		t.Errorf("Expected no lifelogs after reset, got %d", len(logs))
+	}
+}
+
+// sameDayLogs builds n fixture lifelogs on 2024-07-15 for a single Seed call.
+func sameDayLogs(n int) []map[string]interface{} {
+	logs := make([]map[string]interface{}, 0, n)
+	for i := 0; i < n; i++ {
+		logs = append(logs, map[string]interface{}{
+			"id":        i,
+			"date":      "2024-07-15",
+			"startTime": "2024-07-15T10:00:00Z",
+		})
+	}
+	return logs
+}
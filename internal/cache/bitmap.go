@@ -0,0 +1,93 @@
+package cache
+
+import (
+	"sync"
+	"time"
+
+	"github.com/colthorp/limitless-cli-go/internal/core"
+)
+
+// dayBitmap records one bit per calendar day, indexed by days since the Unix
+// epoch. The Manager uses it to remember which days are known to hold a
+// confirmed-complete cache entry (confirmed_complete_up_to_date > data_date),
+// so hybrid streaming can skip the probe, scan and planning on warm ranges.
+//
+// The bitmap lives in memory only and is kept current by the Manager's own
+// cache writes. The zero value is an empty bitmap ready for use.
+type dayBitmap struct {
+	mu   sync.RWMutex
+	bits []uint64
+}
+
+// has reports whether the bit for day is set.
+func (b *dayBitmap) has(day time.Time) bool {
+	idx := core.DayIndex(day)
+	if idx < 0 {
+		return false
+	}
+
+	b.mu.RLock()
+	defer b.mu.RUnlock()
+
+	word := idx / 64
+	if word >= int64(len(b.bits)) {
+		return false
+	}
+	return b.bits[word]&(1<<uint(idx%64)) != 0
+}
+
+// hasRange reports whether the bit for every day in start...end is set.
+func (b *dayBitmap) hasRange(start, end time.Time) bool {
+	first, last := core.DayIndex(start), core.DayIndex(end)
+	if first < 0 || last < first {
+		return false
+	}
+
+	b.mu.RLock()
+	defer b.mu.RUnlock()
+
+	if last/64 >= int64(len(b.bits)) {
+		return false
+	}
+	for idx := first; idx <= last; idx++ {
+		if b.bits[idx/64]&(1<<uint(idx%64)) == 0 {
+			return false
+		}
+	}
+	return true
+}
+
+// set marks day, growing the bitmap as needed.
+func (b *dayBitmap) set(day time.Time) {
+	idx := core.DayIndex(day)
+	if idx < 0 {
+		return
+	}
+
+	b.mu.Lock()
+	defer b.mu.Unlock()
+
+	word := idx / 64
+	if word >= int64(len(b.bits)) {
+		grown := make([]uint64, word+1)
+		copy(grown, b.bits)
+		b.bits = grown
+	}
+	b.bits[word] |= 1 << uint(idx%64)
+}
+
+// unset unmarks day.
+func (b *dayBitmap) unset(day time.Time) {
+	idx := core.DayIndex(day)
+	if idx < 0 {
+		return
+	}
+
+	b.mu.Lock()
+	defer b.mu.Unlock()
+
+	word := idx / 64
+	if word < int64(len(b.bits)) {
+		b.bits[word] &^= 1 << uint(idx%64)
+	}
+}
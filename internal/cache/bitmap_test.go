@@ -0,0 +1,59 @@
+package cache
+
+import (
+	"testing"
+	"time"
+
+	"github.com/colthorp/limitless-cli-go/internal/core"
+)
+
+func TestDayBitmap(t *testing.T) {
+	t.Parallel()
+
+	var bitmap dayBitmap
+
+	day := jul15
+	nextDay := jul16
+
+	if bitmap.has(day) {
+		t.Error("Expected empty bitmap to report day as unset")
+	}
+
+	bitmap.set(day)
+	if !bitmap.has(day) {
+		t.Error("Expected day to be set")
+	}
+	if bitmap.has(nextDay) {
+		t.Error("Expected neighbouring day to remain unset")
+	}
+
+	// Days in a non-UTC location map to the same calendar day
+	local := time.Date(2024, 7, 15, 23, 0, 0, 0, core.GetTZ("America/New_York"))
+	if !bitmap.has(local) {
+		t.Error("Expected local-time day to share the UTC calendar day bit")
+	}
+
+	// A range is covered only when every day in it is set
+	if !bitmap.hasRange(day, day) {
+		t.Error("Expected single-day range to be covered")
+	}
+	if bitmap.hasRange(day, nextDay) {
+		t.Error("Expected range with an unset day to be uncovered")
+	}
+	bitmap.set(nextDay)
+	if !bitmap.hasRange(day, nextDay) {
+		t.Error("Expected range to be covered once every day is set")
+	}
+
+	bitmap.unset(day)
+	if bitmap.has(day) {
+		t.Error("Expected day to be unset after unset")
+	}
+
+	// Pre-epoch days are never tracked
+	old, _ := time.Parse(core.APIDateFmt, "1969-12-31")
+	bitmap.set(old)
+	if bitmap.has(old) {
+		t.Error("Expected pre-epoch day to be ignored")
+	}
+}
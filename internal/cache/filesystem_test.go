@@ -10,6 +10,8 @@ import (
 )
 
 func TestFilesystemBackend(t *testing.T) {
+	t.Parallel()
+
 	// Create temp directory for test
 	tmpDir, err := os.MkdirTemp("", "limitless-cache-test")
 	if err != nil {
@@ -19,7 +21,7 @@ func TestFilesystemBackend(t *testing.T) {
 
 	backend := NewFilesystemBackend(tmpDir)
 
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	confirmedDate := "2024-07-20"
 
 	entry := &CacheEntry{
@@ -73,13 +75,15 @@ func TestFilesystemBackend(t *testing.T) {
 	}
 
 	// Test reading non-existent entry
-	nonExistentDay, _ := time.Parse(core.APIDateFmt, "2024-07-16")
+	nonExistentDay := jul16
 	if backend.Read(nonExistentDay) != nil {
 		t.Error("Expected nil for non-existent entry")
 	}
 }
 
 func TestFilesystemBackendLegacyFormat(t *testing.T) {
+	t.Parallel()
+
 	// Create temp directory for test
 	tmpDir, err := os.MkdirTemp("", "limitless-cache-test")
 	if err != nil {
@@ -99,7 +103,7 @@ func TestFilesystemBackendLegacyFormat(t *testing.T) {
 
 	backend := NewFilesystemBackend(tmpDir)
 
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	entry := backend.Read(day)
 
 	if entry == nil {
@@ -117,6 +121,8 @@ func TestFilesystemBackendLegacyFormat(t *testing.T) {
 }
 
 func TestFilesystemBackendAtomicWrite(t *testing.T) {
+	t.Parallel()
+
 	// Create temp directory for test
 	tmpDir, err := os.MkdirTemp("", "limitless-cache-test")
 	if err != nil {
@@ -151,6 +157,8 @@ func TestFilesystemBackendAtomicWrite(t *testing.T) {
 }
 
 func TestFilesystemBackendPath(t *testing.T) {
+	t.Parallel()
+
 	backend := NewFilesystemBackend("/test/cache")
 
 	tests := []struct {
@@ -0,0 +1,198 @@
+package cache
+
+import (
+	"fmt"
+	"io"
+	"os"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/colthorp/limitless-cli-go/internal/api"
+	"github.com/colthorp/limitless-cli-go/internal/core"
+)
+
+// Tests in this package that only touch their own fixtures call t.Parallel.
+// Tests that change package globals (core.FetchStrategy, os.Stderr) stay
+// sequential; Go finishes every sequential test before resuming the parallel
+// ones, so the globals are back at their defaults by then.
+
+// Fixed test days, parsed once for the whole package.
+var (
+	jul13 = mustParseDate("2024-07-13")
+	jul14 = mustParseDate("2024-07-14")
+	jul15 = mustParseDate("2024-07-15")
+	jul16 = mustParseDate("2024-07-16")
+)
+
+// frozenNow is noon UTC on jul15, the "today" the fixtures are written around.
+var frozenNow = time.Date(2024, 7, 15, 12, 0, 0, 0, time.UTC)
+
+// frozenClock is a Manager clock pinned to frozenNow.
+func frozenClock() time.Time { return frozenNow }
+
+// mustParseDate parses a YYYY-MM-DD fixture date, panicking on bad input.
+func mustParseDate(s string) time.Time {
+	d, err := time.Parse(core.APIDateFmt, s)
+	if err != nil {
+		panic(err)
+	}
+	return d
+}
+
+// newTestManager wires a Manager to an in-memory transport seeded with logs
+// and an empty in-memory backend, returning all three for assertions. The
+// Manager reads the real clock, which suits tests whose fixture days are all
+// safely in the past or that never consult "today".
+func newTestManager(logs ...map[string]interface{}) (*api.InMemoryTransport, *MemoryBackend, *Manager) {
+	transport := api.NewInMemoryTransport(false)
+	transport.Seed(logs...)
+	backend := NewMemoryBackend()
+	return transport, backend, NewManager(api.NewLimitlessAPI(transport), backend, false)
+}
+
+// newFrozenTestManager is newTestManager with the Manager clock pinned to
+// frozenNow, for tests that depend on which fixture day is today.
+func newFrozenTestManager(logs ...map[string]interface{}) (*api.InMemoryTransport, *MemoryBackend, *Manager) {
+	transport, backend, _ := newTestManager(logs...)
+	return transport, backend, newFrozenManager(api.NewLimitlessAPI(transport), backend)
+}
+
+// newFrozenManager is NewManager with the clock pinned to frozenNow, for
+// tests that bring their own API client or backend (e.g. a countingBackend).
+func newFrozenManager(limitlessAPI *api.LimitlessAPI, backend Backend) *Manager {
+	manager := NewManager(limitlessAPI, backend, false)
+	manager.now = frozenClock
+	return manager
+}
+
+// testClock is a Manager clock that a test moves by hand between calls.
+type testClock struct {
+	mu  sync.Mutex
+	now time.Time
+}
+
+// Now returns the clock's current time.
+func (c *testClock) Now() time.Time {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.now
+}
+
+// Set moves the clock to t.
+func (c *testClock) Set(t time.Time) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.now = t
+}
+
+// Advance moves the clock forward by d.
+func (c *testClock) Advance(d time.Duration) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.now = c.now.Add(d)
+}
+
+// newClockedTestManager is newTestManager with the Manager reading a
+// testClock that starts at start, for tests that step time between calls.
+func newClockedTestManager(start time.Time, logs ...map[string]interface{}) (*api.InMemoryTransport, *MemoryBackend, *Manager, *testClock) {
+	transport, backend, manager := newTestManager(logs...)
+	clock := &testClock{now: start}
+	manager.now = clock.Now
+	return transport, backend, manager, clock
+}
+
+// countingBackend is a spy Backend that counts Read, Write and Scan calls
+// before delegating to the wrapped backend. The counters are atomic, so it can
+// sit behind concurrent hybrid gap workers.
+type countingBackend struct {
+	Backend
+	reads  atomic.Int64
+	writes atomic.Int64
+	scans  atomic.Int64
+}
+
+func (b *countingBackend) Read(day time.Time) *CacheEntry {
+	b.reads.Add(1)
+	return b.Backend.Read(day)
+}
+
+func (b *countingBackend) Write(entry *CacheEntry) error {
+	b.writes.Add(1)
+	return b.Backend.Write(entry)
+}
+
+func (b *countingBackend) Scan(executionDate time.Time) map[string]CacheScanResult {
+	b.scans.Add(1)
+	return b.Backend.Scan(executionDate)
+}
+
+// setFetchStrategy switches core.FetchStrategy for the rest of the test and
+// restores the previous strategy when it finishes. Tests that call it must not
+// be parallel.
+func setFetchStrategy(t *testing.T, strategy string) {
+	t.Helper()
+	original := core.FetchStrategy
+	core.FetchStrategy = strategy
+	t.Cleanup(func() { core.FetchStrategy = original })
+}
+
+// captureStderr returns everything written to os.Stderr while fn runs.
+func captureStderr(t *testing.T, fn func()) string {
+	t.Helper()
+
+	r, w, err := os.Pipe()
+	if err != nil {
+		t.Fatalf("os.Pipe: %v", err)
+	}
+	original := os.Stderr
+	os.Stderr = w
+	defer func() { os.Stderr = original }()
+
+	fn()
+
+	w.Close()
+	out, _ := io.ReadAll(r)
+	return string(out)
+}
+
+// takeLogs receives exactly n logs from ch and then requires ch to be closed,
+// so a stream that runs past its limit fails at the first extra log. Any
+// extra logs are drained so the producing goroutine can exit.
+func takeLogs(t *testing.T, ch <-chan map[string]interface{}, n int) []map[string]interface{} {
+	t.Helper()
+
+	logs := make([]map[string]interface{}, 0, n)
+	for len(logs) < n {
+		log, ok := <-ch
+		if !ok {
+			t.Fatalf("Expected %d logs, stream closed after %d", n, len(logs))
+		}
+		logs = append(logs, log)
+	}
+
+	if _, ok := <-ch; ok {
+		extra := 1
+		for range ch {
+			extra++
+		}
+		t.Fatalf("Expected stream to close after %d logs, got %d more", n, extra)
+	}
+	return logs
+}
+
+// lifelog builds a fresh fixture lifelog whose date is the day of startTime.
+func lifelog(id int, startTime string) map[string]interface{} {
+	return map[string]interface{}{"id": id, "date": startTime[:10], "startTime": startTime}
+}
+
+// logIDs renders the ids of logs in order, e.g. "[1 2 3]", for one-line
+// comparisons against an expected sequence.
+func logIDs(logs []map[string]interface{}) string {
+	ids := make([]interface{}, len(logs))
+	for i, log := range logs {
+		ids[i] = log["id"]
+	}
+	return fmt.Sprint(ids)
+}
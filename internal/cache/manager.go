@@ -2,6 +2,7 @@ package cache
 
 import (
 	"fmt"
+	"maps"
 	"strconv"
 	"sync"
 	"time"
@@ -36,18 +37,23 @@ import (
 // # Cache Validity
 //
 // Cache is valid for a past day iff confirmed_complete_up_to_date > data_date.
-// Today's data is always re-fetched. Future dates are skipped unless force_cache.
+// Today's data is re-fetched unless it was fetched within core.TodayTTL.
+// Future dates are skipped unless force_cache.
 type Manager struct {
 	api     *api.LimitlessAPI
 	backend Backend
 	verbose bool
+	now     func() time.Time // Clock for execution dates and refresh times; time.Now unless a test freezes it
 
 	// Internal bookkeeping for cache scanning and session tracking
-	cacheScanCache map[string]map[string]CacheScanResult // Memoized scan results
-	cacheScanLock  sync.Mutex                            // Protects cacheScanCache
-	cacheWriteLock sync.Mutex                            // Ensures atomic writes
-	fetchedSession map[string]bool                       // Days fetched this session (for post-run upgrades)
-	fetchedLock    sync.Mutex                            // Protects fetchedSession
+	cacheScan      map[string]CacheScanResult // Memoized scan for the execution day cacheScanDay, updated in place on writes
+	cacheScanDay   int64                      // Execution day index cacheScan was taken for
+	cacheScanLock  sync.Mutex                 // Protects cacheScan and cacheScanDay
+	cacheWriteLock sync.Mutex                 // Ensures atomic writes
+	fetchedSession map[int64]int64            // Day indexes fetched since the last post-run upgrade, mapped to the execution day index each was fetched on
+	refreshedAt    map[int64]time.Time        // When each day index was last fetched in full
+	fetchedLock    sync.Mutex                 // Protects fetchedSession and refreshedAt
+	confirmedDays  dayBitmap                  // Days known to have a confirmed-complete entry
 }
 
 // NewManager creates a new cache manager with the given API client and backend.
@@ -64,21 +70,27 @@ func NewManager(limitlessAPI *api.LimitlessAPI, backend Backend, verbose bool) *
 		api:            limitlessAPI,
 		backend:        backend,
 		verbose:        verbose,
-		cacheScanCache: make(map[string]map[string]CacheScanResult),
-		fetchedSession: make(map[string]bool),
+		now:            time.Now,
+		fetchedSession: make(map[int64]int64),
+		refreshedAt:    make(map[int64]time.Time),
 	}
 }
 
-// log writes a debug message if verbose mode is enabled.
-func (m *Manager) log(msg string) {
-	core.Eprint(fmt.Sprintf("[Cache] %s", msg), m.verbose)
+// logf writes a debug message if verbose mode is enabled. Formatting is
+// skipped entirely when it is not.
+func (m *Manager) logf(format string, args ...interface{}) {
+	if !m.verbose {
+		return
+	}
+	core.Eprint("[Cache] "+fmt.Sprintf(format, args...), true)
 }
 
 // FetchDay returns logs for the given day, consulting cache when permissible.
 //
 // Cache lookup rules:
 //   - If forceCache: return cached data regardless of confirmation status
-//   - If day == today: always fetch from API (today's data may be incomplete)
+//   - If day == today: fetch from API (today's data may be incomplete) unless
+//     it was fetched in full within core.TodayTTL
 //   - If day > today: skip (return nil) unless forceCache
 //   - If cache exists with confirmed_complete_up_to_date > data_date: use cache
 //   - Otherwise: fetch from API and cache the result
@@ -86,18 +98,18 @@ func (m *Manager) log(msg string) {
 // Returns the logs and a pointer to the day if logs were found (used for
 // determining the "high water mark" for confirmation stamps).
 func (m *Manager) FetchDay(day time.Time, common map[string]string, quiet, forceCache bool) ([]map[string]interface{}, *time.Time) {
-	tzName := common["timezone"]
-	if tzName == "" {
-		tzName = core.DefaultTZ
-	}
-	loc := core.GetTZ(tzName)
-	executionDate := time.Now().In(loc)
+	return m.fetchDayAt(day, common, m.executionDate(common), quiet, forceCache)
+}
+
+// fetchDayAt is FetchDay against a caller-supplied executionDate, so loops
+// over many days resolve the clock and timezone once per run.
+func (m *Manager) fetchDayAt(day time.Time, common map[string]string, executionDate time.Time, quiet, forceCache bool) ([]map[string]interface{}, *time.Time) {
 	execDateOnly := core.DateOnly(executionDate)
 	dayOnly := core.DateOnly(day)
 
 	// Skip future dates unless force cache
 	if dayOnly.After(execDateOnly) && !forceCache {
-		m.log(fmt.Sprintf("Skipping future date %s", core.FormatDate(day)))
+		m.logf("Skipping future date %s", core.FormatDate(day))
 		return nil, nil
 	}
 
@@ -117,19 +129,24 @@ func (m *Manager) FetchDay(day time.Time, common map[string]string, quiet, force
 			needsFetch = false
 		} else {
 			if dayOnly.Equal(execDateOnly) {
-				needsFetch = true // Always refresh today
-			} else if entry.ConfirmedCompleteUpToDate != nil {
-				confirmed, err := time.Parse(core.APIDateFmt, *entry.ConfirmedCompleteUpToDate)
-				if err == nil {
-					dataDate, _ := time.Parse(core.APIDateFmt, entry.DataDate)
-					if confirmed.After(dataDate) {
-						logs = entry.Logs
-						if len(logs) > 0 {
-							maxDateInLogs = &dayOnly
-						}
-						needsFetch = false
+				// Refresh today unless it was just fetched
+				if m.recentlyRefreshed(dayOnly) {
+					logs = entry.Logs
+					if len(logs) > 0 {
+						maxDateInLogs = &dayOnly
 					}
+					needsFetch = false
+				}
+			} else if entryConfirmed(entry) {
+				// Keep the bitmap and the memoized scan in step, so a day
+				// the bitmap vouches for is also known to the scan
+				m.confirmedDays.set(dayOnly)
+				m.recordScanResult(entry)
+				logs = entry.Logs
+				if len(logs) > 0 {
+					maxDateInLogs = &dayOnly
 				}
+				needsFetch = false
 			}
 		}
 	} else if forceCache {
@@ -144,7 +161,9 @@ func (m *Manager) FetchDay(day time.Time, common map[string]string, quiet, force
 		for k, v := range common {
 			params[k] = v
 		}
-		params["timezone"] = tzName
+		if params["timezone"] == "" {
+			params["timezone"] = core.DefaultTZ
+		}
 		params["date"] = core.FormatDate(day)
 		if _, ok := params["limit"]; !ok {
 			params["limit"] = strconv.Itoa(core.PageLimit)
@@ -161,12 +180,26 @@ func (m *Manager) FetchDay(day time.Time, common map[string]string, quiet, force
 		}
 
 		m.saveLogs(day, logs, execDateOnly, execDateOnly, quiet)
-		m.markFetched(day)
+		m.markFetched(day, execDateOnly)
 	}
 
 	return logs, maxDateInLogs
 }
 
+// entryConfirmed reports whether entry is valid for a past day, i.e.
+// confirmed_complete_up_to_date > data_date.
+func entryConfirmed(entry *CacheEntry) bool {
+	if entry.ConfirmedCompleteUpToDate == nil {
+		return false
+	}
+	confirmed, err := time.Parse(core.APIDateFmt, *entry.ConfirmedCompleteUpToDate)
+	if err != nil {
+		return false
+	}
+	dataDate, _ := time.Parse(core.APIDateFmt, entry.DataDate)
+	return confirmed.After(dataDate)
+}
+
 // StreamRange yields logs over start...end inclusive in requested order.
 //
 // Delegates to the appropriate streaming strategy based on configuration:
@@ -222,62 +255,135 @@ func (m *Manager) saveLogs(day time.Time, logs []map[string]interface{}, fetched
 	defer m.cacheWriteLock.Unlock()
 
 	if err := m.backend.Write(entry); err != nil {
-		m.log(fmt.Sprintf("Failed to write cache for %s: %v", core.FormatDate(day), err))
+		m.logf("Failed to write cache for %s: %v", core.FormatDate(day), err)
+		return
 	}
 
-	// Clear scan cache
-	m.cacheScanLock.Lock()
-	m.cacheScanCache = make(map[string]map[string]CacheScanResult)
-	m.cacheScanLock.Unlock()
+	if confirmed != nil && confirmed.After(core.DateOnly(day)) {
+		m.confirmedDays.set(day)
+	} else {
+		m.confirmedDays.unset(day)
+	}
+	m.recordScanResult(entry)
+}
+
+// executionDate returns the Manager's current time in the request timezone
+// (common["timezone"], falling back to core.DefaultTZ).
+func (m *Manager) executionDate(common map[string]string) time.Time {
+	tzName := common["timezone"]
+	if tzName == "" {
+		tzName = core.DefaultTZ
+	}
+	return m.now().In(core.GetTZ(tzName))
 }
 
-// markFetched records that a day was fetched this session.
+// markFetched records that a day was fetched on executionDate.
 // Used by postRunUpgradeConfirmations to know which days need stamp upgrades.
-func (m *Manager) markFetched(day time.Time) {
+func (m *Manager) markFetched(day, executionDate time.Time) {
 	m.fetchedLock.Lock()
 	defer m.fetchedLock.Unlock()
-	m.fetchedSession[core.FormatDate(day)] = true
+	idx := core.DayIndex(day)
+	m.fetchedSession[idx] = core.DayIndex(executionDate)
+	m.refreshedAt[idx] = m.now()
 }
 
-// scanCacheDirectory returns cache status for all dates <= executionDate.
-// Results are memoized per execution date to avoid repeated filesystem scans.
-// The scan cache is cleared whenever a new cache entry is written.
-func (m *Manager) scanCacheDirectory(executionDate time.Time) map[string]CacheScanResult {
-	cacheKey := fmt.Sprintf("scan_%s", core.FormatDate(executionDate))
+// recentlyRefreshed reports whether day was fetched in full within core.TodayTTL.
+func (m *Manager) recentlyRefreshed(day time.Time) bool {
+	m.fetchedLock.Lock()
+	defer m.fetchedLock.Unlock()
+	at, ok := m.refreshedAt[core.DayIndex(day)]
+	return ok && m.now().Sub(at) < core.TodayTTL
+}
+
+// forgetFetched drops the fetch records for day, e.g. after its cache entry
+// was overwritten with partial data, so it is neither reused as fresh within
+// core.TodayTTL nor upgraded after the run.
+func (m *Manager) forgetFetched(day time.Time) {
+	m.fetchedLock.Lock()
+	defer m.fetchedLock.Unlock()
+	idx := core.DayIndex(day)
+	delete(m.fetchedSession, idx)
+	delete(m.refreshedAt, idx)
+}
+
+// withCacheScan calls fn with the memoized cache status for all dates <=
+// executionDate, scanning the backend only when no scan is memoized for that
+// execution date. Only the latest execution date's scan is kept, and entries
+// written through the Manager are folded into it by recordScanResult, so a
+// scan is taken once per execution date. fn runs under cacheScanLock and must
+// neither modify nor retain the map.
+func (m *Manager) withCacheScan(executionDate time.Time, fn func(map[string]CacheScanResult)) {
+	day := core.DayIndex(executionDate)
 
 	m.cacheScanLock.Lock()
-	if cached, ok := m.cacheScanCache[cacheKey]; ok {
-		m.cacheScanLock.Unlock()
-		return cached
+	defer m.cacheScanLock.Unlock()
+
+	if m.cacheScan == nil || m.cacheScanDay != day {
+		m.cacheScan = m.backend.Scan(executionDate)
+		m.cacheScanDay = day
 	}
-	m.cacheScanLock.Unlock()
+	fn(m.cacheScan)
+}
 
-	result := m.backend.Scan(executionDate)
+// scanCacheDirectory returns a snapshot of cache status for all dates <=
+// executionDate. The snapshot is the caller's own; later writes update the
+// memoized scan but not snapshots already handed out.
+func (m *Manager) scanCacheDirectory(executionDate time.Time) map[string]CacheScanResult {
+	var snapshot map[string]CacheScanResult
+	m.withCacheScan(executionDate, func(scan map[string]CacheScanResult) {
+		snapshot = maps.Clone(scan)
+	})
+	return snapshot
+}
+
+// recordScanResult folds a just-written entry into the memoized scan, in
+// place, if the scan covers its date.
+func (m *Manager) recordScanResult(entry *CacheEntry) {
+	var confirmedUpTo *time.Time
+	if entry.ConfirmedCompleteUpToDate != nil {
+		if t, err := time.Parse(core.APIDateFmt, *entry.ConfirmedCompleteUpToDate); err == nil {
+			confirmedUpTo = &t
+		}
+	}
+	result := CacheScanResult{
+		HasLogs:       len(entry.Logs) > 0,
+		ConfirmedUpTo: confirmedUpTo,
+	}
+	// Scans only include entries with a valid date
+	entryDay, ok := core.ParseDayPrefix(entry.DataDate)
+	if !ok {
+		return
+	}
+	entryIdx := core.DayIndex(entryDay)
 
 	m.cacheScanLock.Lock()
-	m.cacheScanCache[cacheKey] = result
-	m.cacheScanLock.Unlock()
+	defer m.cacheScanLock.Unlock()
 
-	return result
+	// Scans only cover dates up to their execution date
+	if m.cacheScan == nil || entryIdx > m.cacheScanDay {
+		return
+	}
+	m.cacheScan[entry.DataDate] = result
 }
 
 // getGlobalLatestNonEmptyDate returns the latest date with non-empty data.
 // This is the "high water mark" used for setting confirmation stamps.
 func (m *Manager) getGlobalLatestNonEmptyDate(executionDate time.Time) *time.Time {
-	cacheData := m.scanCacheDirectory(executionDate)
 	var latest *time.Time
 
-	for dateStr, result := range cacheData {
-		if result.HasLogs {
-			d, err := time.Parse(core.APIDateFmt, dateStr)
-			if err != nil {
-				continue
-			}
-			if latest == nil || d.After(*latest) {
-				latest = &d
+	m.withCacheScan(executionDate, func(cacheData map[string]CacheScanResult) {
+		for dateStr, result := range cacheData {
+			if result.HasLogs {
+				d, err := time.Parse(core.APIDateFmt, dateStr)
+				if err != nil {
+					continue
+				}
+				if latest == nil || d.After(*latest) {
+					latest = &d
+				}
 			}
 		}
-	}
+	})
 
 	return latest
 }
@@ -286,27 +392,28 @@ func (m *Manager) getGlobalLatestNonEmptyDate(executionDate time.Time) *time.Tim
 // Used when saving cache entries to set their confirmed_complete_up_to_date field.
 // Returns nil if no later date with data exists in cache.
 func (m *Manager) getMaxKnownNonEmptyDataDate(currentDate, executionDate time.Time, quiet bool) *time.Time {
-	cacheData := m.scanCacheDirectory(executionDate)
 	var maxDate *time.Time
 
 	currentDateOnly := core.DateOnly(currentDate)
 
-	for dateStr, result := range cacheData {
-		d, err := time.Parse(core.APIDateFmt, dateStr)
-		if err != nil {
-			continue
-		}
+	m.withCacheScan(executionDate, func(cacheData map[string]CacheScanResult) {
+		for dateStr, result := range cacheData {
+			d, err := time.Parse(core.APIDateFmt, dateStr)
+			if err != nil {
+				continue
+			}
 
-		if !d.After(currentDateOnly) {
-			continue
-		}
+			if !d.After(currentDateOnly) {
+				continue
+			}
 
-		if result.HasLogs {
-			if maxDate == nil || d.After(*maxDate) {
-				maxDate = &d
+			if result.HasLogs {
+				if maxDate == nil || d.After(*maxDate) {
+					maxDate = &d
+				}
 			}
 		}
-	}
+	})
 
 	return maxDate
 }
@@ -398,7 +505,7 @@ func (m *Manager) shouldProbeForCompleteness(days []time.Time, executionDate tim
 
 // performLatestDataProbe fetches one log from the probe day to establish completeness.
 func (m *Manager) performLatestDataProbe(probeDay time.Time, common map[string]string, executionDate time.Time, quiet bool) bool {
-	m.log(fmt.Sprintf("Probe for %s…", core.FormatDate(probeDay)))
+	m.logf("Probe for %s…", core.FormatDate(probeDay))
 
 	params := make(map[string]string)
 	for k, v := range common {
@@ -413,38 +520,48 @@ func (m *Manager) performLatestDataProbe(probeDay time.Time, common map[string]s
 	}
 
 	if len(probeLogs) > 0 {
+		// The probe stores a single log, so the day no longer counts as fresh
 		m.saveLogs(probeDay, probeLogs, executionDate, executionDate, quiet)
+		m.forgetFetched(probeDay)
 		return true
 	}
 
 	return false
 }
 
-// postRunUpgradeConfirmations upgrades confirmation stamps for fetched days.
-func (m *Manager) postRunUpgradeConfirmations(finalMaxDate, executionDate time.Time, quiet bool) {
+// postRunUpgradeConfirmations upgrades confirmation stamps for the days in
+// start...end fetched since the last upgrade, then forgets them, so a
+// long-lived Manager (e.g. the MCP server) does not revisit them on every
+// later run. Days outside the range are left for the runs that cover them.
+// Days that were fetched while they were still today may be missing later
+// logs and are never upgraded; the next fetch of the day stamps it instead.
+func (m *Manager) postRunUpgradeConfirmations(start, end, finalMaxDate, executionDate time.Time, quiet bool) {
+	startIdx, endIdx := core.DayIndex(start), core.DayIndex(end)
+
 	m.fetchedLock.Lock()
-	if len(m.fetchedSession) == 0 {
-		m.fetchedLock.Unlock()
-		return
-	}
-	fetchedDates := make([]string, 0, len(m.fetchedSession))
-	for dateStr := range m.fetchedSession {
-		fetchedDates = append(fetchedDates, dateStr)
+	fetchedDays := make([]time.Time, 0)
+	for idx, fetchedOn := range m.fetchedSession {
+		if idx < startIdx || idx > endIdx {
+			continue
+		}
+		if idx < fetchedOn {
+			fetchedDays = append(fetchedDays, core.DayFromIndex(idx))
+		}
+		delete(m.fetchedSession, idx)
 	}
 	m.fetchedLock.Unlock()
 
+	if len(fetchedDays) == 0 {
+		return
+	}
+
 	globalLatest := m.getGlobalLatestNonEmptyDate(executionDate)
 	effectiveMax := finalMaxDate
 	if globalLatest != nil && globalLatest.After(finalMaxDate) {
 		effectiveMax = *globalLatest
 	}
 
-	for _, dateStr := range fetchedDates {
-		d, err := time.Parse(core.APIDateFmt, dateStr)
-		if err != nil {
-			continue
-		}
-
+	for _, d := range fetchedDays {
 		if d.Equal(effectiveMax) || d.After(effectiveMax) {
 			continue
 		}
@@ -470,9 +587,11 @@ func (m *Manager) postRunUpgradeConfirmations(finalMaxDate, executionDate time.T
 
 			m.cacheWriteLock.Lock()
 			if err := m.backend.Write(entry); err != nil {
-				m.log(fmt.Sprintf("Failed to upgrade confirmation for %s: %v", dateStr, err))
+				m.logf("Failed to upgrade confirmation for %s: %v", entry.DataDate, err)
 			} else {
-				m.log(fmt.Sprintf("Confirmation upgraded for %s → %s", dateStr, effectiveMaxStr))
+				m.confirmedDays.set(d)
+				m.recordScanResult(entry)
+				m.logf("Confirmation upgraded for %s → %s", entry.DataDate, effectiveMaxStr)
 			}
 			m.cacheWriteLock.Unlock()
 		}
@@ -1,25 +1,23 @@
 package cache
 
 import (
+	"fmt"
+	"strings"
 	"testing"
 	"time"
 
-	"github.com/colthorp/limitless-cli-go/internal/api"
 	"github.com/colthorp/limitless-cli-go/internal/core"
 )
 
 func TestManagerFetchDay(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-15", "startTime": "2024-07-15T11:00:00Z"},
-	)
+	t.Parallel()
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
+	_, backend, manager := newTestManager(
+		lifelog(1, "2024-07-15T10:00:00Z"),
+		lifelog(2, "2024-07-15T11:00:00Z"),
+	)
 
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	common := map[string]string{
 		"timezone": "UTC",
 		"limit":    "10",
@@ -42,9 +40,9 @@ func TestManagerFetchDay(t *testing.T) {
 }
 
 func TestManagerFetchDayFromCache(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
+	t.Parallel()
+
+	transport, backend, manager := newTestManager()
 
 	// Pre-populate cache with confirmed entry
 	confirmedDate := "2024-07-20"
@@ -55,9 +53,7 @@ func TestManagerFetchDayFromCache(t *testing.T) {
 		ConfirmedCompleteUpToDate: &confirmedDate,
 	})
 
-	manager := NewManager(limitlessAPI, backend, false)
-
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	common := map[string]string{
 		"timezone": "UTC",
 	}
@@ -74,10 +70,47 @@ func TestManagerFetchDayFromCache(t *testing.T) {
 	}
 }
 
+// TestManagerFetchDayRecordsConfirmedHitInScan verifies that a confirmed cache
+// hit the memoized scan has not seen, e.g. one written by another process,
+// is folded into the scan along with the confirmed-day bitmap.
+func TestManagerFetchDayRecordsConfirmedHitInScan(t *testing.T) {
+	t.Parallel()
+
+	_, backend, manager := newTestManager()
+	execDate := mustParseDate("2024-07-20")
+
+	// Memoize a scan before the entry exists
+	if len(manager.scanCacheDirectory(execDate)) != 0 {
+		t.Fatal("Expected an empty initial scan")
+	}
+
+	confirmedDate := "2024-07-14"
+	backend.Seed(&CacheEntry{
+		Logs:                      []map[string]interface{}{lifelog(1, "2024-07-13T10:00:00Z")},
+		DataDate:                  "2024-07-13",
+		FetchedOnDate:             "2024-07-14",
+		ConfirmedCompleteUpToDate: &confirmedDate,
+	})
+
+	common := map[string]string{"timezone": "UTC"}
+	logs, _ := manager.fetchDayAt(jul13, common, execDate, true, false)
+	if len(logs) != 1 {
+		t.Fatalf("Expected 1 log from cache, got %d", len(logs))
+	}
+
+	if !manager.confirmedDays.has(jul13) {
+		t.Error("Expected the confirmed hit to be recorded in the bitmap")
+	}
+	scan, ok := manager.scanCacheDirectory(execDate)["2024-07-13"]
+	if !ok || !scan.HasLogs || scan.ConfirmedUpTo == nil || !scan.ConfirmedUpTo.After(jul13) {
+		t.Errorf("Expected the confirmed hit to be recorded in the scan, got %+v (present=%v)", scan, ok)
+	}
+}
+
 func TestManagerForceCacheMode(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
+	t.Parallel()
+
+	transport, backend, manager := newTestManager()
 
 	// Pre-populate cache without confirmation (normally would trigger refetch)
 	backend.Seed(&CacheEntry{
@@ -87,9 +120,7 @@ func TestManagerForceCacheMode(t *testing.T) {
 		// No ConfirmedCompleteUpToDate
 	})
 
-	manager := NewManager(limitlessAPI, backend, false)
-
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	common := map[string]string{
 		"timezone": "UTC",
 	}
@@ -107,10 +138,47 @@ func TestManagerForceCacheMode(t *testing.T) {
 	}
 }
 
+func TestManagerFetchDaySkipsFutureByClock(t *testing.T) {
+	t.Parallel()
+
+	transport, _, manager := newFrozenTestManager(
+		lifelog(1, "2024-07-16T10:00:00Z"),
+	)
+
+	// jul16 is tomorrow for the frozen clock, so it is skipped without a request
+	logs, maxDate := manager.FetchDay(jul16, map[string]string{"timezone": "UTC"}, true, false)
+	if logs != nil || maxDate != nil {
+		t.Errorf("Expected future day to be skipped, got %d logs", len(logs))
+	}
+	if transport.RequestsMade() != 0 {
+		t.Errorf("Expected 0 API requests for a future day, got %d", transport.RequestsMade())
+	}
+}
+
+func TestManagerVerboseLogging(t *testing.T) {
+	for _, verbose := range []bool{false, true} {
+		t.Run(fmt.Sprintf("verbose=%v", verbose), func(t *testing.T) {
+			_, _, manager := newFrozenTestManager()
+			manager.verbose = verbose
+
+			out := captureStderr(t, func() {
+				manager.FetchDay(jul16, map[string]string{"timezone": "UTC"}, true, false)
+			})
+
+			logged := strings.Contains(out, "[Cache] Skipping future date 2024-07-16")
+			if logged != verbose {
+				t.Errorf("Expected skip message logged=%v, got stderr %q", verbose, out)
+			}
+		})
+	}
+}
+
 func TestMemoryBackend(t *testing.T) {
+	t.Parallel()
+
 	backend := NewMemoryBackend()
 
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	confirmedDate := "2024-07-20"
 
 	entry := &CacheEntry{
@@ -155,20 +223,97 @@ func TestMemoryBackend(t *testing.T) {
 	}
 }
 
-func TestStreamDaily(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-		map[string]interface{}{"id": 3, "date": "2024-07-16", "startTime": "2024-07-16T10:00:00Z"},
-	)
+func TestMemoryBackendReset(t *testing.T) {
+	t.Parallel()
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
 	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
+	backend.Seed(
+		&CacheEntry{Logs: []map[string]interface{}{{"id": 1}}, DataDate: "2024-07-14"},
+		&CacheEntry{Logs: []map[string]interface{}{{"id": 2}}, DataDate: "2024-07-15"},
+	)
+
+	backend.Reset()
+
+	day := jul14
+	if entry := backend.Read(day); entry != nil {
+		t.Errorf("Expected no entry after reset, got %+v", entry)
+	}
+
+	// The backend stays usable after a reset
+	backend.Seed(&CacheEntry{Logs: []map[string]interface{}{{"id": 3}}, DataDate: "2024-07-14"})
+	entry := backend.Read(day)
+	if entry == nil || len(entry.Logs) != 1 || entry.Logs[0]["id"] != 3 {
+		t.Errorf("Expected reseeded entry after reset, got %+v", entry)
+	}
+}
 
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	end, _ := time.Parse(core.APIDateFmt, "2024-07-16")
+// TestManagerScanMemoUpdatedInPlace verifies that writes update the one
+// memoized scan without touching snapshots already handed out, and that a
+// new execution date replaces the memo rather than adding to it.
+func TestManagerScanMemoUpdatedInPlace(t *testing.T) {
+	t.Parallel()
+
+	backend := &countingBackend{Backend: NewMemoryBackend()}
+	manager := NewManager(nil, backend, false)
+	execDate := mustParseDate("2024-07-20")
+
+	snapshot := manager.scanCacheDirectory(execDate)
+	manager.saveLogs(jul13, []map[string]interface{}{lifelog(1, "2024-07-13T10:00:00Z")}, execDate, execDate, true)
+
+	if _, ok := snapshot["2024-07-13"]; ok {
+		t.Error("Expected the earlier snapshot to be unaffected by the write")
+	}
+	if !manager.scanCacheDirectory(execDate)["2024-07-13"].HasLogs {
+		t.Error("Expected the write to be recorded in the memoized scan")
+	}
+	if backend.scans.Load() != 1 {
+		t.Errorf("Expected 1 scan for one execution date, got %d", backend.scans.Load())
+	}
+
+	// Only the latest execution date's scan is kept
+	manager.scanCacheDirectory(execDate.AddDate(0, 0, 1))
+	manager.scanCacheDirectory(execDate)
+	if backend.scans.Load() != 3 {
+		t.Errorf("Expected a rescan after the execution date changed back, got %d scans", backend.scans.Load())
+	}
+}
+
+// TestPostRunUpgradeKeepsOtherRangesFetched verifies that a run's post-run
+// upgrade only consumes the fetched days inside its own range, leaving those
+// of other runs on a shared Manager for their own upgrades.
+func TestPostRunUpgradeKeepsOtherRangesFetched(t *testing.T) {
+	t.Parallel()
+
+	_, _, manager := newFrozenTestManager()
+	jul12 := mustParseDate("2024-07-12")
+
+	// jul15 was fetched by another run while it is today, jul12 by this one
+	manager.markFetched(jul15, frozenNow)
+	manager.markFetched(jul12, frozenNow)
+
+	manager.postRunUpgradeConfirmations(jul12, jul13, jul14, frozenNow, true)
+
+	manager.fetchedLock.Lock()
+	defer manager.fetchedLock.Unlock()
+	if _, ok := manager.fetchedSession[core.DayIndex(jul12)]; ok {
+		t.Error("Expected the run to consume its own fetched day")
+	}
+	if fetchedOn, ok := manager.fetchedSession[core.DayIndex(jul15)]; !ok || fetchedOn != core.DayIndex(jul15) {
+		t.Error("Expected the other run's fetched day to be kept")
+	}
+}
+
+func TestStreamDaily(t *testing.T) {
+	t.Parallel()
+
+	_, _, manager := newTestManager(
+		lifelog(1, "2024-07-14T10:00:00Z"),
+		lifelog(2, "2024-07-15T10:00:00Z"),
+		lifelog(3, "2024-07-16T10:00:00Z"),
+	)
+
+	start := jul14
+	end := jul16
 
 	common := map[string]string{
 		"timezone":  "UTC",
@@ -181,21 +326,14 @@ func TestStreamDaily(t *testing.T) {
 		logs = append(logs, log)
 	}
 
-	if len(logs) != 3 {
-		t.Errorf("Expected 3 logs, got %d", len(logs))
-	}
-
-	// Verify ascending order
-	if len(logs) >= 2 {
-		id1 := logs[0]["id"].(int)
-		id2 := logs[1]["id"].(int)
-		if id1 > id2 {
-			t.Error("Expected logs in ascending order")
-		}
+	if got := logIDs(logs); got != "[1 2 3]" {
+		t.Errorf("Expected logs 1-3 in ascending order, got %s", got)
 	}
 }
 
 func TestHybridPlanGeneration(t *testing.T) {
+	t.Parallel()
+
 	backend := NewMemoryBackend()
 	manager := NewManager(nil, backend, false)
 
@@ -217,11 +355,11 @@ func TestHybridPlanGeneration(t *testing.T) {
 		},
 	)
 
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	end, _ := time.Parse(core.APIDateFmt, "2024-07-16")
+	start := jul14
+	end := jul16
 	execDate, _ := time.Parse(core.APIDateFmt, "2024-07-20")
 
-	plan := manager.planHybridFetch(start, end, execDate)
+	plan := manager.planHybridFetch(start, end, execDate, manager.scanCacheDirectory(execDate))
 
 	// Should have one gap for 2024-07-15
 	if len(plan) != 1 {
@@ -238,3 +376,47 @@ func TestHybridPlanGeneration(t *testing.T) {
 	}
 }
 
+func TestManagerFetchTodayWithinTTL(t *testing.T) {
+	t.Parallel()
+
+	// jul15 is today throughout
+	transport, _, manager, clock := newClockedTestManager(frozenNow,
+		lifelog(1, "2024-07-15T10:00:00Z"),
+	)
+
+	common := map[string]string{
+		"timezone": "UTC",
+		"limit":    "10",
+	}
+
+	logs, _ := manager.FetchDay(jul15, common, true, false)
+	if len(logs) != 1 {
+		t.Fatalf("Expected 1 log for today, got %d", len(logs))
+	}
+	requests := transport.RequestsMade()
+
+	// A second fetch within the TTL reuses the fresh cache entry
+	clock.Advance(core.TodayTTL - time.Second)
+	logs, _ = manager.FetchDay(jul15, common, true, false)
+	if len(logs) != 1 {
+		t.Errorf("Expected 1 cached log for today, got %d", len(logs))
+	}
+	if transport.RequestsMade() != requests {
+		t.Errorf("Expected no API request within TTL, got %d new", transport.RequestsMade()-requests)
+	}
+
+	// Once the TTL has passed, today is fetched again
+	clock.Advance(time.Second)
+	manager.FetchDay(jul15, common, true, false)
+	if transport.RequestsMade() != requests+1 {
+		t.Errorf("Expected today to be re-fetched once the TTL expired, got %d new requests", transport.RequestsMade()-requests)
+	}
+	requests = transport.RequestsMade()
+
+	// Dropping the refresh record forces a re-fetch even within the TTL
+	manager.forgetFetched(jul15)
+	manager.FetchDay(jul15, common, true, false)
+	if transport.RequestsMade() != requests+1 {
+		t.Error("Expected today to be re-fetched after its refresh record was dropped")
+	}
+}
@@ -90,11 +90,11 @@ func (b *MemoryBackend) Scan(executionDate time.Time) map[string]CacheScanResult
 	return result
 }
 
-// Reset clears all entries (for testing).
+// Reset clears all entries in place (for testing).
 func (b *MemoryBackend) Reset() {
 	b.mu.Lock()
 	defer b.mu.Unlock()
-	b.entries = make(map[string]*CacheEntry)
+	clear(b.entries)
 }
 
 // Seed adds entries directly (for testing).
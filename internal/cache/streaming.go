@@ -17,18 +17,12 @@ func (m *Manager) streamDaily(start, end time.Time, common map[string]string, ma
 	go func() {
 		defer close(ch)
 
-		tzName := common["timezone"]
-		if tzName == "" {
-			tzName = core.DefaultTZ
-		}
-		loc := core.GetTZ(tzName)
-		executionDate := time.Now().In(loc)
+		executionDate := m.executionDate(common)
 		execDateOnly := core.DateOnly(executionDate)
 
 		// Generate list of days to process
 		days := make([]time.Time, 0)
-		for d := start; !d.After(end); d = d.AddDate(0, 0, 1) {
-			dayOnly := core.DateOnly(d)
+		for _, dayOnly := range dayRange(start, end) {
 			if dayOnly.After(execDateOnly) && !forceCache {
 				continue
 			}
@@ -57,7 +51,7 @@ func (m *Manager) streamDaily(start, end time.Time, common map[string]string, ma
 		// Fetch logs for each day
 		logsByDay := make(map[string][]map[string]interface{})
 		for _, day := range days {
-			logs, _ := m.FetchDay(day, common, quiet, forceCache)
+			logs, _ := m.fetchDayAt(day, common, executionDate, quiet, forceCache)
 			logsByDay[core.FormatDate(day)] = logs
 		}
 
@@ -72,7 +66,7 @@ func (m *Manager) streamDaily(start, end time.Time, common map[string]string, ma
 			}
 		}
 		if latestNonEmpty != nil {
-			m.postRunUpgradeConfirmations(*latestNonEmpty, executionDate, quiet)
+			m.postRunUpgradeConfirmations(core.DateOnly(start), core.DateOnly(end), *latestNonEmpty, executionDate, quiet)
 		}
 
 		// Yield logs in requested order
@@ -81,16 +75,7 @@ func (m *Manager) streamDaily(start, end time.Time, common map[string]string, ma
 			direction = "desc"
 		}
 
-		orderedLogs := m.orderLogsByDirection(logsByDay, direction)
-
-		count := 0
-		for _, log := range orderedLogs {
-			if maxResults > 0 && count >= maxResults {
-				break
-			}
-			ch <- log
-			count++
-		}
+		m.emitLogsByDirection(ch, logsByDay, direction, maxResults)
 	}()
 
 	return ch
@@ -103,17 +88,12 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 	go func() {
 		defer close(ch)
 
-		tzName := common["timezone"]
-		if tzName == "" {
-			tzName = core.DefaultTZ
-		}
-		loc := core.GetTZ(tzName)
-		executionDate := time.Now().In(loc)
+		executionDate := m.executionDate(common)
 		execDateOnly := core.DateOnly(executionDate)
 
 		startOnly := core.DateOnly(start)
 		if startOnly.After(execDateOnly) {
-			m.log(fmt.Sprintf("Skipping future date range %s > %s", core.FormatDate(start), core.FormatDate(executionDate)))
+			m.logf("Skipping future date range %s > %s", core.FormatDate(start), core.FormatDate(executionDate))
 			return
 		}
 
@@ -128,8 +108,8 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 			params[k] = v
 		}
 		delete(params, "date")
-		params["start"] = fmt.Sprintf("%s 00:00:00", core.FormatDate(start))
-		params["end"] = fmt.Sprintf("%s 23:59:59", core.FormatDate(effectiveEnd))
+		params["start"] = core.FormatDate(start) + core.DayStartSuffix
+		params["end"] = core.FormatDate(effectiveEnd) + core.DayEndSuffix
 		if _, ok := params["limit"]; !ok {
 			params["limit"] = strconv.Itoa(core.PageLimit)
 		}
@@ -147,12 +127,8 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 
 			// Extract date from log
 			dateStr := getLogDateStr(log)
-			if dateStr == "" {
-				continue
-			}
-
-			d, err := time.Parse(core.APIDateFmt, dateStr[:10])
-			if err != nil {
+			d, ok := core.ParseDayPrefix(dateStr)
+			if !ok {
 				continue
 			}
 
@@ -161,12 +137,16 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 				continue
 			}
 
-			dayStr := core.FormatDate(d)
+			dayStr := dateStr[:10]
 			logsByDay[dayStr] = append(logsByDay[dayStr], log)
 		}
 
+		// A fetch capped by maxResults may stop partway through a day, so
+		// its days are cached but not recorded as fetched in full
+		truncated := maxResults > 0 && fetched >= maxResults
+
 		// Cache results by day
-		for d := startOnly; !d.After(core.DateOnly(effectiveEnd)); d = d.AddDate(0, 0, 1) {
+		for _, d := range dayRange(startOnly, effectiveEnd) {
 			if d.After(execDateOnly) {
 				continue
 			}
@@ -177,7 +157,11 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 				dayLogs = []map[string]interface{}{}
 			}
 			m.saveLogs(d, dayLogs, execDateOnly, execDateOnly, quiet)
-			m.markFetched(d)
+			if truncated {
+				m.forgetFetched(d)
+			} else {
+				m.markFetched(d, execDateOnly)
+			}
 		}
 
 		// Apply post-run confirmation upgrades
@@ -191,7 +175,7 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 			}
 		}
 		if latestNonEmpty != nil {
-			m.postRunUpgradeConfirmations(*latestNonEmpty, executionDate, quiet)
+			m.postRunUpgradeConfirmations(startOnly, effectiveEnd, *latestNonEmpty, executionDate, quiet)
 		}
 
 		// Yield logs in requested order
@@ -200,16 +184,7 @@ func (m *Manager) streamBulk(start, end time.Time, common map[string]string, max
 			direction = "desc"
 		}
 
-		orderedLogs := m.orderLogsByDirection(logsByDay, direction)
-
-		count := 0
-		for _, log := range orderedLogs {
-			if maxResults > 0 && count >= maxResults {
-				break
-			}
-			ch <- log
-			count++
-		}
+		m.emitLogsByDirection(ch, logsByDay, direction, maxResults)
 	}()
 
 	return ch
@@ -222,17 +197,12 @@ func (m *Manager) streamHybrid(start, end time.Time, common map[string]string, m
 	go func() {
 		defer close(ch)
 
-		tzName := common["timezone"]
-		if tzName == "" {
-			tzName = core.DefaultTZ
-		}
-		loc := core.GetTZ(tzName)
-		executionDate := time.Now().In(loc)
+		executionDate := m.executionDate(common)
 		execDateOnly := core.DateOnly(executionDate)
 
 		startOnly := core.DateOnly(start)
 		if startOnly.After(execDateOnly) {
-			m.log(fmt.Sprintf("Skipping future date range %s > %s", core.FormatDate(start), core.FormatDate(executionDate)))
+			m.logf("Skipping future date range %s > %s", core.FormatDate(start), core.FormatDate(executionDate))
 			return
 		}
 
@@ -243,15 +213,26 @@ func (m *Manager) streamHybrid(start, end time.Time, common map[string]string, m
 		effectiveEndOnly := core.DateOnly(effectiveEnd)
 
 		// Generate list of days for probe check
-		days := make([]time.Time, 0)
-		for d := startOnly; !d.After(effectiveEndOnly); d = d.AddDate(0, 0, 1) {
-			days = append(days, d)
+		days := dayRange(startOnly, effectiveEndOnly)
+
+		direction := common["direction"]
+		if direction == "" {
+			direction = "desc"
+		}
+
+		// Warm past ranges are served straight from cache, without the
+		// probe, scan snapshot or plan
+		if !forceCache && effectiveEndOnly.Before(execDateOnly) {
+			if logsByDay, ok := m.readConfirmedRange(days); ok {
+				m.logf("Range confirmed in cache, skipping scan and planning")
+				m.emitLogsByDirection(ch, logsByDay, direction, maxResults)
+				return
+			}
 		}
 
 		// Check if we need to probe for completeness before planning
 		if !forceCache && len(days) > 0 {
-			cacheData := m.scanCacheDirectory(executionDate)
-			if m.shouldProbeForCompleteness(days, executionDate, cacheData, forceCache) {
+			if m.shouldProbeForCompleteness(days, executionDate, m.scanCacheDirectory(executionDate), forceCache) {
 				// Probe the day after the range (up to today)
 				maxDay := effectiveEndOnly
 				probeDay := maxDay.AddDate(0, 0, 1)
@@ -264,38 +245,38 @@ func (m *Manager) streamHybrid(start, end time.Time, common map[string]string, m
 			}
 		}
 
+		// Snapshot the scan once, after any probe write, for both planning
+		// and filling the days the plan leaves to the cache
+		cacheData := m.scanCacheDirectory(executionDate)
+
 		// Plan the hybrid fetch
-		plan := m.planHybridFetch(startOnly, effectiveEndOnly, execDateOnly)
-		m.log(fmt.Sprintf("Execution plan: %v", plan))
+		plan := m.planHybridFetch(startOnly, effectiveEndOnly, execDateOnly, cacheData)
+		m.logf("Execution plan: %v", plan)
 
-		logsByDay := make(map[string][]map[string]interface{})
+		var logsByDay map[string][]map[string]interface{}
 
 		if len(plan) == 0 {
 			// No gaps need fetching, use cached data
-			m.log("Using cached data only")
-			for d := startOnly; !d.After(effectiveEndOnly); d = d.AddDate(0, 0, 1) {
-				entry := m.backend.Read(d)
-				if entry != nil {
-					logsByDay[core.FormatDate(d)] = entry.Logs
-				}
-			}
+			m.logf("Using cached data only")
+			logsByDay = make(map[string][]map[string]interface{})
 		} else {
 			// Execute the plan
-			m.log(fmt.Sprintf("Executing plan with %d gaps", len(plan)))
-			fetchedData := m.executeHybridPlan(plan, common, quiet, parallel)
-			for k, v := range fetchedData {
-				logsByDay[k] = v
-			}
+			m.logf("Executing plan with %d gaps", len(plan))
+			logsByDay = m.executeHybridPlan(plan, common, executionDate, quiet, parallel)
+		}
 
-			// Fill in remaining days from cache
-			for d := startOnly; !d.After(effectiveEndOnly); d = d.AddDate(0, 0, 1) {
-				dayStr := core.FormatDate(d)
-				if _, exists := logsByDay[dayStr]; !exists {
-					entry := m.backend.Read(d)
-					if entry != nil {
-						logsByDay[dayStr] = entry.Logs
-					}
-				}
+		// Fill in remaining days from cache, skipping only the days the
+		// scan records as empty
+		for _, d := range days {
+			dayStr := core.FormatDate(d)
+			if _, exists := logsByDay[dayStr]; exists {
+				continue
+			}
+			if scan, scanned := cacheData[dayStr]; scanned && !scan.HasLogs {
+				continue
+			}
+			if entry := m.backend.Read(d); entry != nil {
+				logsByDay[dayStr] = entry.Logs
 			}
 		}
 
@@ -310,25 +291,11 @@ func (m *Manager) streamHybrid(start, end time.Time, common map[string]string, m
 			}
 		}
 		if latestNonEmpty != nil {
-			m.postRunUpgradeConfirmations(*latestNonEmpty, executionDate, quiet)
+			m.postRunUpgradeConfirmations(startOnly, effectiveEndOnly, *latestNonEmpty, executionDate, quiet)
 		}
 
 		// Yield logs in requested order
-		direction := common["direction"]
-		if direction == "" {
-			direction = "desc"
-		}
-
-		orderedLogs := m.orderLogsByDirection(logsByDay, direction)
-
-		count := 0
-		for _, log := range orderedLogs {
-			if maxResults > 0 && count >= maxResults {
-				break
-			}
-			ch <- log
-			count++
-		}
+		m.emitLogsByDirection(ch, logsByDay, direction, maxResults)
 	}()
 
 	return ch
@@ -341,29 +308,55 @@ type Gap struct {
 	Strategy string // "bulk" or "daily"
 }
 
+// readConfirmedRange reads days straight from cache when the confirmed-day
+// bitmap covers all of them. It reports false if the bitmap does not, or if
+// an entry turns out missing or unconfirmed (e.g. changed by another
+// process), clearing that stale bit so the caller falls back to planning.
+func (m *Manager) readConfirmedRange(days []time.Time) (map[string][]map[string]interface{}, bool) {
+	if len(days) == 0 || !m.confirmedDays.hasRange(days[0], days[len(days)-1]) {
+		return nil, false
+	}
+
+	logsByDay := make(map[string][]map[string]interface{})
+	for _, d := range days {
+		entry := m.backend.Read(d)
+		if entry == nil || !entryConfirmed(entry) {
+			m.confirmedDays.unset(d)
+			return nil, false
+		}
+		if len(entry.Logs) > 0 {
+			logsByDay[core.FormatDate(d)] = entry.Logs
+		}
+	}
+	return logsByDay, true
+}
+
 // planHybridFetch identifies which sub-ranges require API calls.
-func (m *Manager) planHybridFetch(start, end, executionDate time.Time) []Gap {
+//
+// Cache status comes from cacheData, a scan the caller has already taken, so
+// planning never reads cache entries. Days the scan shows as confirmed are
+// recorded in the confirmed-day bitmap for later runs.
+func (m *Manager) planHybridFetch(start, end, executionDate time.Time, cacheData map[string]CacheScanResult) []Gap {
 	// Determine per-day fetch requirements
 	needsAPI := make([]time.Time, 0)
 
-	for d := start; !d.After(end) && !d.After(executionDate); d = d.AddDate(0, 0, 1) {
+	last := end
+	if last.After(executionDate) {
+		last = executionDate
+	}
+
+	for _, d := range dayRange(start, last) {
 		needs := false
 
 		if d.Equal(executionDate) {
-			needs = true // Always refresh today
+			needs = !m.recentlyRefreshed(d) // Refresh today unless just fetched
 		} else {
-			entry := m.backend.Read(d)
-			if entry == nil {
-				needs = true // No cache
+			// Missing or unconfirmed in the scan: fetch
+			scan, ok := cacheData[core.FormatDate(d)]
+			if !ok || scan.ConfirmedUpTo == nil || !scan.ConfirmedUpTo.After(d) {
+				needs = true
 			} else {
-				if entry.ConfirmedCompleteUpToDate == nil {
-					needs = true
-				} else {
-					confirmed, err := time.Parse(core.APIDateFmt, *entry.ConfirmedCompleteUpToDate)
-					if err != nil || !confirmed.After(d) {
-						needs = true
-					}
-				}
+				m.confirmedDays.set(d)
 			}
 		}
 
@@ -382,7 +375,7 @@ func (m *Manager) planHybridFetch(start, end, executionDate time.Time) []Gap {
 	gapEnd := gapStart
 
 	for _, day := range needsAPI[1:] {
-		if day.Equal(gapEnd.AddDate(0, 0, 1)) {
+		if day.Equal(gapEnd.Add(24 * time.Hour)) {
 			gapEnd = day
 		} else {
 			gaps = append(gaps, Gap{Start: gapStart, End: gapEnd})
@@ -409,8 +402,9 @@ func (m *Manager) planHybridFetch(start, end, executionDate time.Time) []Gap {
 	return gaps
 }
 
-// executeHybridPlan executes the hybrid plan by fetching each gap.
-func (m *Manager) executeHybridPlan(plan []Gap, common map[string]string, quiet bool, parallel int) map[string][]map[string]interface{} {
+// executeHybridPlan executes the hybrid plan by fetching each gap. Every gap
+// is judged against the same executionDate.
+func (m *Manager) executeHybridPlan(plan []Gap, common map[string]string, executionDate time.Time, quiet bool, parallel int) map[string][]map[string]interface{} {
 	result := make(map[string][]map[string]interface{})
 	var mu sync.Mutex
 
@@ -420,7 +414,7 @@ func (m *Manager) executeHybridPlan(plan []Gap, common map[string]string, quiet
 
 	if len(plan) == 1 {
 		// Single gap, execute directly
-		gapResult := m.executeGap(plan[0], common, quiet)
+		gapResult := m.executeGap(plan[0], common, executionDate, quiet)
 		return gapResult
 	}
 
@@ -435,7 +429,7 @@ func (m *Manager) executeHybridPlan(plan []Gap, common map[string]string, quiet
 			semaphore <- struct{}{}
 			defer func() { <-semaphore }()
 
-			gapResult := m.executeGap(g, common, quiet)
+			gapResult := m.executeGap(g, common, executionDate, quiet)
 
 			mu.Lock()
 			for k, v := range gapResult {
@@ -450,38 +444,28 @@ func (m *Manager) executeHybridPlan(plan []Gap, common map[string]string, quiet
 }
 
 // executeGap executes a single gap using the specified strategy.
-func (m *Manager) executeGap(gap Gap, common map[string]string, quiet bool) map[string][]map[string]interface{} {
+func (m *Manager) executeGap(gap Gap, common map[string]string, executionDate time.Time, quiet bool) map[string][]map[string]interface{} {
 	result := make(map[string][]map[string]interface{})
+	execDateOnly := core.DateOnly(executionDate)
 
-	m.log(fmt.Sprintf("Executing gap %s-%s using %s strategy", core.FormatDate(gap.Start), core.FormatDate(gap.End), gap.Strategy))
+	m.logf("Executing gap %s-%s using %s strategy", core.FormatDate(gap.Start), core.FormatDate(gap.End), gap.Strategy)
 
 	if gap.Strategy == "bulk" {
 		// Collect logs from bulk stream
-		for log := range m.streamBulkInternal(gap.Start, gap.End, common, 0, true) {
+		for log := range m.streamBulkInternal(gap.Start, gap.End, common, executionDate, 0, true) {
 			dateStr := getLogDateStr(log)
-			if dateStr == "" {
-				continue
-			}
-			d, err := time.Parse(core.APIDateFmt, dateStr[:10])
-			if err != nil {
+			d, ok := core.ParseDayPrefix(dateStr)
+			if !ok {
 				continue
 			}
-			dayStr := core.FormatDate(d)
+			dayStr := dateStr[:10]
 			if !d.Before(gap.Start) && !d.After(gap.End) {
 				result[dayStr] = append(result[dayStr], log)
 			}
 		}
 
 		// Cache results by day after bulk fetch
-		tzName := common["timezone"]
-		if tzName == "" {
-			tzName = core.DefaultTZ
-		}
-		loc := core.GetTZ(tzName)
-		executionDate := time.Now().In(loc)
-		execDateOnly := core.DateOnly(executionDate)
-
-		for d := gap.Start; !d.After(gap.End); d = d.AddDate(0, 0, 1) {
+		for _, d := range dayRange(gap.Start, gap.End) {
 			if d.After(execDateOnly) {
 				continue
 			}
@@ -491,12 +475,12 @@ func (m *Manager) executeGap(gap Gap, common map[string]string, quiet bool) map[
 				dayLogs = []map[string]interface{}{}
 			}
 			m.saveLogs(d, dayLogs, execDateOnly, execDateOnly, quiet)
-			m.markFetched(d)
+			m.markFetched(d, execDateOnly)
 		}
 	} else {
 		// Daily strategy
-		for d := gap.Start; !d.After(gap.End); d = d.AddDate(0, 0, 1) {
-			logs, _ := m.FetchDay(d, common, true, false)
+		for _, d := range dayRange(gap.Start, gap.End) {
+			logs, _ := m.fetchDayAt(d, common, executionDate, true, false)
 			result[core.FormatDate(d)] = logs
 		}
 	}
@@ -505,18 +489,12 @@ func (m *Manager) executeGap(gap Gap, common map[string]string, quiet bool) map[
 }
 
 // streamBulkInternal is an internal bulk fetch that doesn't cache (used by hybrid).
-func (m *Manager) streamBulkInternal(start, end time.Time, common map[string]string, maxResults int, quiet bool) <-chan map[string]interface{} {
+func (m *Manager) streamBulkInternal(start, end time.Time, common map[string]string, executionDate time.Time, maxResults int, quiet bool) <-chan map[string]interface{} {
 	ch := make(chan map[string]interface{})
 
 	go func() {
 		defer close(ch)
 
-		tzName := common["timezone"]
-		if tzName == "" {
-			tzName = core.DefaultTZ
-		}
-		loc := core.GetTZ(tzName)
-		executionDate := time.Now().In(loc)
 		execDateOnly := core.DateOnly(executionDate)
 
 		effectiveEnd := end
@@ -529,8 +507,8 @@ func (m *Manager) streamBulkInternal(start, end time.Time, common map[string]str
 			params[k] = v
 		}
 		delete(params, "date")
-		params["start"] = fmt.Sprintf("%s 00:00:00", core.FormatDate(start))
-		params["end"] = fmt.Sprintf("%s 23:59:59", core.FormatDate(effectiveEnd))
+		params["start"] = core.FormatDate(start) + core.DayStartSuffix
+		params["end"] = core.FormatDate(effectiveEnd) + core.DayEndSuffix
 		if _, ok := params["limit"]; !ok {
 			params["limit"] = strconv.Itoa(core.PageLimit)
 		}
@@ -543,8 +521,12 @@ func (m *Manager) streamBulkInternal(start, end time.Time, common map[string]str
 	return ch
 }
 
-// orderLogsByDirection orders logs by the specified direction.
-func (m *Manager) orderLogsByDirection(logsByDay map[string][]map[string]interface{}, direction string) []map[string]interface{} {
+// emitLogsByDirection sends logs to ch day by day in the specified direction,
+// stopping after maxResults logs when maxResults is positive. Each day's logs
+// keep the order they were fetched or cached in, so only the day keys are
+// sorted; the limit is applied by truncating a day's slice to the remaining
+// budget rather than counting every log.
+func (m *Manager) emitLogsByDirection(ch chan<- map[string]interface{}, logsByDay map[string][]map[string]interface{}, direction string, maxResults int) {
 	// Get sorted date keys
 	dates := make([]string, 0, len(logsByDay))
 	for dateStr := range logsByDay {
@@ -558,13 +540,39 @@ func (m *Manager) orderLogsByDirection(logsByDay map[string][]map[string]interfa
 		return dates[i] < dates[j]
 	})
 
-	// Flatten logs
-	result := make([]map[string]interface{}, 0)
+	remaining := maxResults
 	for _, dateStr := range dates {
-		result = append(result, logsByDay[dateStr]...)
+		logs := logsByDay[dateStr]
+		if maxResults > 0 {
+			if remaining == 0 {
+				return
+			}
+			if len(logs) > remaining {
+				logs = logs[:remaining]
+			}
+			remaining -= len(logs)
+		}
+		for _, log := range logs {
+			ch <- log
+		}
 	}
+}
 
-	return result
+// dayRange returns every calendar day from start to end inclusive as UTC
+// midnights. UTC days are a fixed 24 hours, so the list is built with plain
+// additions rather than per-day calendar normalization.
+func dayRange(start, end time.Time) []time.Time {
+	first := core.DateOnly(start)
+	last := core.DateOnly(end)
+	if last.Before(first) {
+		return nil
+	}
+
+	days := make([]time.Time, 0, int(last.Sub(first)/(24*time.Hour))+1)
+	for d := first; !d.After(last); d = d.Add(24 * time.Hour) {
+		days = append(days, d)
+	}
+	return days
 }
 
 // getLogDateStr extracts the date string from a log entry.
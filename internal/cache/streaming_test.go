@@ -1,6 +1,8 @@
 package cache
 
 import (
+	"fmt"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -9,24 +11,16 @@ import (
 )
 
 func TestStreamBulk(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-		map[string]interface{}{"id": 3, "date": "2024-07-16", "startTime": "2024-07-16T10:00:00Z"},
+	_, backend, manager := newTestManager(
+		lifelog(1, "2024-07-14T10:00:00Z"),
+		lifelog(2, "2024-07-15T10:00:00Z"),
+		lifelog(3, "2024-07-16T10:00:00Z"),
 	)
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
-
-	// Force bulk strategy
-	originalStrategy := core.FetchStrategy
-	core.FetchStrategy = core.FetchStrategyBulk
-	defer func() { core.FetchStrategy = originalStrategy }()
+	setFetchStrategy(t, core.FetchStrategyBulk)
 
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	end, _ := time.Parse(core.APIDateFmt, "2024-07-16")
+	start := jul14
+	end := jul16
 
 	common := map[string]string{
 		"timezone":  "UTC",
@@ -54,16 +48,12 @@ func TestStreamBulk(t *testing.T) {
 }
 
 func TestStreamHybrid(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-		map[string]interface{}{"id": 3, "date": "2024-07-16", "startTime": "2024-07-16T10:00:00Z"},
+	_, backend, manager := newTestManager(
+		lifelog(1, "2024-07-14T10:00:00Z"),
+		lifelog(2, "2024-07-15T10:00:00Z"),
+		lifelog(3, "2024-07-16T10:00:00Z"),
 	)
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-
 	// Pre-populate some cache entries
 	confirmedDate := "2024-07-20"
 	backend.Seed(&CacheEntry{
@@ -73,15 +63,10 @@ func TestStreamHybrid(t *testing.T) {
 		ConfirmedCompleteUpToDate: &confirmedDate,
 	})
 
-	manager := NewManager(limitlessAPI, backend, false)
-
-	// Force hybrid strategy
-	originalStrategy := core.FetchStrategy
-	core.FetchStrategy = core.FetchStrategyHybrid
-	defer func() { core.FetchStrategy = originalStrategy }()
+	setFetchStrategy(t, core.FetchStrategyHybrid)
 
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	end, _ := time.Parse(core.APIDateFmt, "2024-07-16")
+	start := jul14
+	end := jul16
 
 	common := map[string]string{
 		"timezone":  "UTC",
@@ -100,106 +85,78 @@ func TestStreamHybrid(t *testing.T) {
 	}
 }
 
-func TestStreamMaxResults(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	for i := 0; i < 10; i++ {
-		transport.Seed(map[string]interface{}{
-			"id":        i,
-			"date":      "2024-07-15",
-			"startTime": "2024-07-15T10:00:00Z",
-		})
-	}
-
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
-
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-15")
-
-	common := map[string]string{
-		"timezone":  "UTC",
-		"direction": "desc",
-		"limit":     "10",
-	}
-
-	// Limit to 5 results
-	logs := make([]map[string]interface{}, 0)
-	for log := range manager.StreamRange(start, start, common, 5, true, false, 1) {
-		logs = append(logs, log)
-	}
-
-	if len(logs) != 5 {
-		t.Errorf("Expected 5 logs (max_results), got %d", len(logs))
-	}
-}
-
-func TestStreamDirection(t *testing.T) {
+// TestStreamCommonBehaviour checks max results and ordering under every fetch
+// strategy. Each strategy seeds one transport and backend, reset between cases.
+func TestStreamCommonBehaviour(t *testing.T) {
 	transport := api.NewInMemoryTransport(false)
 	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-		map[string]interface{}{"id": 3, "date": "2024-07-16", "startTime": "2024-07-16T10:00:00Z"},
+		lifelog(1, "2024-07-14T10:00:00Z"),
 	)
-
+	busyDay := make([]map[string]interface{}, 0, 10)
+	for i := 0; i < 10; i++ {
+		busyDay = append(busyDay, lifelog(100+i, fmt.Sprintf("2024-07-15T10:%02d:00Z", i)))
+	}
+	transport.Seed(busyDay...)
 	limitlessAPI := api.NewLimitlessAPI(transport)
 	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
-
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	end, _ := time.Parse(core.APIDateFmt, "2024-07-16")
 
-	// Test descending order
-	common := map[string]string{
-		"timezone":  "UTC",
-		"direction": "desc",
-		"limit":     "10",
+	cases := []struct {
+		name       string
+		start, end time.Time
+		direction  string
+		maxResults int
+		wantCount  int
+		wantFirst  string
+		wantLast   string
+	}{
+		{"max results", jul15, jul15, "desc", 5, 5, "2024-07-15", "2024-07-15"},
+		{"descending", jul13, jul15, "desc", 0, 11, "2024-07-15", "2024-07-14"},
+		{"ascending", jul13, jul15, "asc", 0, 11, "2024-07-14", "2024-07-15"},
 	}
 
-	logs := make([]map[string]interface{}, 0)
-	for log := range manager.StreamRange(start, end, common, 0, true, false, 1) {
-		logs = append(logs, log)
-	}
-
-	if len(logs) >= 2 {
-		// First log should be from 2024-07-16 (descending)
-		firstDate := logs[0]["date"].(string)
-		lastDate := logs[len(logs)-1]["date"].(string)
-		if firstDate < lastDate {
-			t.Error("Expected descending order")
-		}
-	}
-
-	// Reset backend
-	backend.Reset()
-
-	// Test ascending order
-	common["direction"] = "asc"
-
-	logs = make([]map[string]interface{}, 0)
-	for log := range manager.StreamRange(start, end, common, 0, true, false, 1) {
-		logs = append(logs, log)
-	}
-
-	if len(logs) >= 2 {
-		// First log should be from 2024-07-14 (ascending)
-		firstDate := logs[0]["date"].(string)
-		lastDate := logs[len(logs)-1]["date"].(string)
-		if firstDate > lastDate {
-			t.Error("Expected ascending order")
-		}
+	strategies := []string{core.FetchStrategyPerDay, core.FetchStrategyBulk, core.FetchStrategyHybrid}
+	for _, strategy := range strategies {
+		t.Run(strategy, func(t *testing.T) {
+			setFetchStrategy(t, strategy)
+
+			for _, tc := range cases {
+				t.Run(tc.name, func(t *testing.T) {
+					backend.Reset()
+					manager := newFrozenManager(limitlessAPI, backend)
+
+					common := map[string]string{
+						"timezone":  "UTC",
+						"direction": tc.direction,
+						"limit":     "50", // one page holds every fixture log
+					}
+
+					ch := manager.StreamRange(tc.start, tc.end, common, tc.maxResults, true, false, 1)
+					logs := takeLogs(t, ch, tc.wantCount)
+
+					if first := logs[0]["date"]; first != tc.wantFirst {
+						t.Errorf("Expected first log from %s, got %v", tc.wantFirst, first)
+					}
+					if last := logs[len(logs)-1]["date"]; last != tc.wantLast {
+						t.Errorf("Expected last log from %s, got %v", tc.wantLast, last)
+					}
+				})
+			}
+		})
 	}
 }
 
 func TestHybridGapStrategy(t *testing.T) {
+	t.Parallel()
+
 	backend := NewMemoryBackend()
 	manager := NewManager(nil, backend, false)
 
 	// Test that large gaps use bulk strategy
 	start, _ := time.Parse(core.APIDateFmt, "2024-07-01")
 	end, _ := time.Parse(core.APIDateFmt, "2024-07-10")
-	execDate, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	execDate := jul15
 
-	plan := manager.planHybridFetch(start, end, execDate)
+	plan := manager.planHybridFetch(start, end, execDate, manager.scanCacheDirectory(execDate))
 
 	// Should have one gap covering all 10 days
 	if len(plan) != 1 {
@@ -212,13 +169,11 @@ func TestHybridGapStrategy(t *testing.T) {
 }
 
 func TestCacheConfirmationLogic(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-	)
+	t.Parallel()
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
+	transport, backend, manager := newTestManager(
+		lifelog(1, "2024-07-15T10:00:00Z"),
+	)
 
 	// Pre-populate cache WITHOUT confirmation
 	backend.Seed(&CacheEntry{
@@ -228,9 +183,7 @@ func TestCacheConfirmationLogic(t *testing.T) {
 		// No ConfirmedCompleteUpToDate - should trigger refetch
 	})
 
-	manager := NewManager(limitlessAPI, backend, false)
-
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul15
 	common := map[string]string{
 		"timezone": "UTC",
 		"limit":    "10",
@@ -254,25 +207,17 @@ func TestCacheConfirmationLogic(t *testing.T) {
 // sub-strategy for a gap, it properly caches the results by day.
 // This was a bug where streamBulkInternal didn't cache, causing repeated API calls.
 func TestHybridBulkGapCachesResults(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
-	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-15", "startTime": "2024-07-15T10:00:00Z"},
-		map[string]interface{}{"id": 3, "date": "2024-07-16", "startTime": "2024-07-16T10:00:00Z"},
-		map[string]interface{}{"id": 4, "date": "2024-07-17", "startTime": "2024-07-17T10:00:00Z"},
-		map[string]interface{}{"id": 5, "date": "2024-07-18", "startTime": "2024-07-18T10:00:00Z"},
+	transport, backend, manager := newTestManager(
+		lifelog(1, "2024-07-14T10:00:00Z"),
+		lifelog(2, "2024-07-15T10:00:00Z"),
+		lifelog(3, "2024-07-16T10:00:00Z"),
+		lifelog(4, "2024-07-17T10:00:00Z"),
+		lifelog(5, "2024-07-18T10:00:00Z"),
 	)
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
-
-	// Force hybrid strategy
-	originalStrategy := core.FetchStrategy
-	core.FetchStrategy = core.FetchStrategyHybrid
-	defer func() { core.FetchStrategy = originalStrategy }()
+	setFetchStrategy(t, core.FetchStrategyHybrid)
 
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
+	start := jul14
 	end, _ := time.Parse(core.APIDateFmt, "2024-07-18")
 
 	common := map[string]string{
@@ -338,28 +283,22 @@ func TestHybridBulkGapCachesResults(t *testing.T) {
 // strategy performs a smart probe to establish cache confirmation.
 // This was a bug where hybrid didn't probe, so cached data was never considered valid.
 func TestHybridSmartProbeEstablishesConfirmation(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
+	transport, backend, manager := newFrozenTestManager()
+
 	// Data for yesterday (2024-07-14)
 	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
-		map[string]interface{}{"id": 2, "date": "2024-07-14", "startTime": "2024-07-14T11:00:00Z"},
+		lifelog(1, "2024-07-14T10:00:00Z"),
+		lifelog(2, "2024-07-14T11:00:00Z"),
 	)
 	// Data for today (2024-07-15) - used by probe
 	transport.Seed(
-		map[string]interface{}{"id": 3, "date": "2024-07-15", "startTime": "2024-07-15T08:00:00Z"},
+		lifelog(3, "2024-07-15T08:00:00Z"),
 	)
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
-
-	// Force hybrid strategy
-	originalStrategy := core.FetchStrategy
-	core.FetchStrategy = core.FetchStrategyHybrid
-	defer func() { core.FetchStrategy = originalStrategy }()
+	setFetchStrategy(t, core.FetchStrategyHybrid)
 
 	// Request yesterday's data
-	yesterday, _ := time.Parse(core.APIDateFmt, "2024-07-14")
+	yesterday := jul14
 
 	common := map[string]string{
 		"timezone":  "UTC",
@@ -398,23 +337,121 @@ func TestHybridSmartProbeEstablishesConfirmation(t *testing.T) {
 	}
 }
 
+// TestPostRunConfirmationUpgrade verifies that every strategy stamps the
+// earlier days of a fetched range as confirmed up to the latest day with data.
+func TestPostRunConfirmationUpgrade(t *testing.T) {
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+		"limit":     "10",
+	}
+
+	strategies := []string{core.FetchStrategyPerDay, core.FetchStrategyBulk, core.FetchStrategyHybrid}
+	for _, strategy := range strategies {
+		t.Run(strategy, func(t *testing.T) {
+			setFetchStrategy(t, strategy)
+
+			_, backend, manager := newFrozenTestManager(
+				lifelog(1, "2024-07-12T10:00:00Z"),
+				lifelog(2, "2024-07-14T10:00:00Z"),
+			)
+
+			start := mustParseDate("2024-07-12")
+			takeLogs(t, manager.StreamRange(start, jul14, common, 0, true, false, 1), 2)
+
+			for _, dateStr := range []string{"2024-07-12", "2024-07-13"} {
+				entry := backend.Read(mustParseDate(dateStr))
+				if entry == nil || entry.ConfirmedCompleteUpToDate == nil {
+					t.Fatalf("Expected %s to be cached with a confirmation stamp", dateStr)
+				}
+				if got := *entry.ConfirmedCompleteUpToDate; got != "2024-07-14" {
+					t.Errorf("Expected %s confirmed up to 2024-07-14, got %s", dateStr, got)
+				}
+			}
+		})
+	}
+}
+
+// TestPostRunUpgradeSkipsDaysFetchedAsToday verifies that a day fetched
+// before midnight, while it was still today, is not confirmed by a run after
+// midnight, so the logs it gained later are fetched on the next request.
+func TestPostRunUpgradeSkipsDaysFetchedAsToday(t *testing.T) {
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+		"limit":     "10",
+	}
+
+	strategies := []string{core.FetchStrategyPerDay, core.FetchStrategyBulk, core.FetchStrategyHybrid}
+	for _, strategy := range strategies {
+		t.Run(strategy, func(t *testing.T) {
+			setFetchStrategy(t, strategy)
+
+			transport, backend, manager, clock := newClockedTestManager(
+				time.Date(2024, 7, 15, 23, 0, 0, 0, time.UTC),
+				lifelog(1, "2024-07-15T22:00:00Z"),
+			)
+
+			if logs, _ := manager.FetchDay(jul15, common, true, false); len(logs) != 1 {
+				t.Fatalf("Expected 1 log before midnight, got %d", len(logs))
+			}
+
+			// After midnight jul15 gains a late log and an unrelated run fetches jul16
+			transport.Seed(lifelog(2, "2024-07-15T23:30:00Z"), lifelog(3, "2024-07-16T00:30:00Z"))
+			clock.Set(time.Date(2024, 7, 16, 1, 0, 0, 0, time.UTC))
+			takeLogs(t, manager.StreamRange(jul16, jul16, common, 0, true, false, 1), 1)
+
+			if entry := backend.Read(jul15); entry == nil || entry.ConfirmedCompleteUpToDate != nil {
+				t.Fatalf("Expected 2024-07-15 to stay unconfirmed, got %+v", entry)
+			}
+			if got := logIDs(takeLogs(t, manager.StreamRange(jul15, jul15, common, 0, true, false, 1), 2)); got != "[1 2]" {
+				t.Errorf("Expected both logs for 2024-07-15, got %s", got)
+			}
+		})
+	}
+}
+
+// TestTruncatedBulkTodayIsNotReused verifies that a bulk fetch of today cut
+// short by maxResults does not count as a fresh refresh, so an unlimited
+// request within core.TodayTTL fetches today in full.
+func TestTruncatedBulkTodayIsNotReused(t *testing.T) {
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+		"limit":     "10",
+	}
+
+	_, _, manager := newFrozenTestManager(
+		lifelog(1, "2024-07-15T09:00:00Z"),
+		lifelog(2, "2024-07-15T10:00:00Z"),
+		lifelog(3, "2024-07-15T11:00:00Z"),
+	)
+
+	setFetchStrategy(t, core.FetchStrategyBulk)
+	takeLogs(t, manager.StreamRange(jul15, jul15, common, 1, true, false, 1), 1)
+
+	setFetchStrategy(t, core.FetchStrategyHybrid)
+	if got := logIDs(takeLogs(t, manager.StreamRange(jul15, jul15, common, 0, true, false, 1), 3)); got != "[1 2 3]" {
+		t.Errorf("Expected today in full after a truncated fetch, got %s", got)
+	}
+}
+
 // TestExecuteGapBulkCachesAllDays verifies that executeGap with bulk strategy
 // caches results for all days in the gap, including days with no logs.
 func TestExecuteGapBulkCachesAllDays(t *testing.T) {
-	transport := api.NewInMemoryTransport(false)
+	t.Parallel()
+
+	transport, backend, manager := newTestManager()
+
 	// Only seed data for some days, leaving gaps
 	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
+		lifelog(1, "2024-07-14T10:00:00Z"),
 		// No data for 2024-07-15
-		map[string]interface{}{"id": 2, "date": "2024-07-16", "startTime": "2024-07-16T10:00:00Z"},
+		lifelog(2, "2024-07-16T10:00:00Z"),
 	)
 
-	limitlessAPI := api.NewLimitlessAPI(transport)
-	backend := NewMemoryBackend()
-	manager := NewManager(limitlessAPI, backend, false)
-
-	start, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	end, _ := time.Parse(core.APIDateFmt, "2024-07-16")
+	start := jul14
+	end := jul16
 
 	common := map[string]string{
 		"timezone":  "UTC",
@@ -427,7 +464,7 @@ func TestExecuteGapBulkCachesAllDays(t *testing.T) {
 		Strategy: "bulk",
 	}
 
-	result := manager.executeGap(gap, common, true)
+	result := manager.executeGap(gap, common, manager.executionDate(common), true)
 
 	// Should have entries for all 3 days
 	if len(result) < 2 {
@@ -444,7 +481,7 @@ func TestExecuteGapBulkCachesAllDays(t *testing.T) {
 	}
 
 	// Verify 2024-07-15 has empty logs array (not nil)
-	day15, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day15 := jul15
 	entry15 := backend.Read(day15)
 	if entry15 == nil {
 		t.Error("Expected cache entry for 2024-07-15")
@@ -458,11 +495,13 @@ func TestExecuteGapBulkCachesAllDays(t *testing.T) {
 // TestShouldProbeForCompletenessWithoutLaterCache verifies that the probe check
 // correctly identifies when a probe is needed (no later cache data exists).
 func TestShouldProbeForCompletenessWithoutLaterCache(t *testing.T) {
+	t.Parallel()
+
 	backend := NewMemoryBackend()
 	manager := NewManager(nil, backend, false)
 
-	yesterday, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	today, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	yesterday := jul14
+	today := jul15
 
 	// No cache exists at all
 	cacheData := make(map[string]CacheScanResult)
@@ -493,15 +532,17 @@ func TestShouldProbeForCompletenessWithoutLaterCache(t *testing.T) {
 // TestCacheValidityRequiresConfirmationAfterDataDate verifies the core caching
 // invariant: cache is only valid if confirmed_complete_up_to_date > data_date.
 func TestCacheValidityRequiresConfirmationAfterDataDate(t *testing.T) {
+	t.Parallel()
+
 	transport := api.NewInMemoryTransport(false)
 	transport.Seed(
-		map[string]interface{}{"id": 1, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
+		lifelog(1, "2024-07-14T10:00:00Z"),
 	)
 
 	limitlessAPI := api.NewLimitlessAPI(transport)
 	backend := NewMemoryBackend()
 
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-14")
+	day := jul14
 
 	// Test 1: Cache with confirmation EQUAL to data_date (should NOT be valid)
 	sameDate := "2024-07-14"
@@ -528,7 +569,7 @@ func TestCacheValidityRequiresConfirmationAfterDataDate(t *testing.T) {
 	backend.Reset()
 	transport.Reset()
 	transport.Seed(
-		map[string]interface{}{"id": 2, "date": "2024-07-14", "startTime": "2024-07-14T10:00:00Z"},
+		lifelog(2, "2024-07-14T10:00:00Z"),
 	)
 
 	// Test 2: Cache with confirmation AFTER data_date (should be valid)
@@ -562,11 +603,13 @@ func TestCacheValidityRequiresConfirmationAfterDataDate(t *testing.T) {
 // correctly returns true when a day's confirmation equals the day itself.
 // This is a regression test for a bug where confirmed < day was used instead of confirmed <= day.
 func TestShouldProbeWithConfirmationEqualToDay(t *testing.T) {
+	t.Parallel()
+
 	backend := NewMemoryBackend()
 	manager := NewManager(nil, backend, false)
 
-	day, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	today, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day := jul14
+	today := jul15
 
 	// Cache exists with confirmation == data_date (not valid per caching rules)
 	sameDate := "2024-07-14"
@@ -604,7 +647,7 @@ func TestShouldProbeWithConfirmationEqualToDay(t *testing.T) {
 		ConfirmedCompleteUpToDate: &laterDate,
 	})
 
-	confirmedTime, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	confirmedTime := jul15
 	cacheData = map[string]CacheScanResult{
 		"2024-07-14": {
 			HasLogs:       true,
@@ -622,11 +665,13 @@ func TestShouldProbeWithConfirmationEqualToDay(t *testing.T) {
 // in shouldProbeForCompleteness works correctly by checking individual cache entries
 // before doing a full cache scan.
 func TestOptimisticShortCircuitInProbeCheck(t *testing.T) {
+	t.Parallel()
+
 	backend := NewMemoryBackend()
 	manager := NewManager(nil, backend, false)
 
-	day1, _ := time.Parse(core.APIDateFmt, "2024-07-14")
-	day2, _ := time.Parse(core.APIDateFmt, "2024-07-15")
+	day1 := jul14
+	day2 := jul15
 	today, _ := time.Parse(core.APIDateFmt, "2024-07-20")
 
 	// One day has confirmation beyond the range, one doesn't
@@ -657,3 +702,410 @@ func TestOptimisticShortCircuitInProbeCheck(t *testing.T) {
 	}
 }
 
+// TestPlanHybridFetchSkipsConfirmedDays verifies that planning a confirmed
+// range works from one scan snapshot and never reads cache entries.
+func TestPlanHybridFetchSkipsConfirmedDays(t *testing.T) {
+	t.Parallel()
+
+	memory := NewMemoryBackend()
+	confirmedDate := "2024-07-20"
+	entries := make([]*CacheEntry, 0, 3)
+	for _, dateStr := range []string{"2024-07-14", "2024-07-15", "2024-07-16"} {
+		entries = append(entries, &CacheEntry{
+			Logs:                      []map[string]interface{}{{"id": dateStr}},
+			DataDate:                  dateStr,
+			FetchedOnDate:             dateStr,
+			ConfirmedCompleteUpToDate: &confirmedDate,
+		})
+	}
+	memory.Seed(entries...)
+	backend := &countingBackend{Backend: memory}
+	manager := NewManager(nil, backend, false)
+
+	start := jul14
+	end := jul16
+	execDate, _ := time.Parse(core.APIDateFmt, "2024-07-20")
+
+	// One scan snapshot serves every plan over the range
+	cacheData := manager.scanCacheDirectory(execDate)
+
+	if plan := manager.planHybridFetch(start, end, execDate, cacheData); len(plan) != 0 {
+		t.Fatalf("Expected empty plan for confirmed range, got %v", plan)
+	}
+	if plan := manager.planHybridFetch(start, end, execDate, cacheData); len(plan) != 0 {
+		t.Fatalf("Expected empty plan on re-plan, got %v", plan)
+	}
+	if backend.reads.Load() != 0 || backend.scans.Load() != 1 {
+		t.Errorf("Expected planning to use the one scan (0 reads, 1 scan), got %d reads, %d scans", backend.reads.Load(), backend.scans.Load())
+	}
+}
+
+// slowReadBackend holds each Read briefly and records the most Reads in
+// flight at once, so a test can observe how many gaps run concurrently.
+type slowReadBackend struct {
+	Backend
+	inFlight atomic.Int64
+	peak     atomic.Int64
+}
+
+func (b *slowReadBackend) Read(day time.Time) *CacheEntry {
+	n := b.inFlight.Add(1)
+	defer b.inFlight.Add(-1)
+	for {
+		peak := b.peak.Load()
+		if n <= peak || b.peak.CompareAndSwap(peak, n) {
+			break
+		}
+	}
+	time.Sleep(20 * time.Millisecond)
+	return b.Backend.Read(day)
+}
+
+// TestExecuteHybridPlanBoundsParallelGaps verifies that a multi-gap plan
+// fetches every gap and runs up to `parallel` of them at once, no more.
+func TestExecuteHybridPlanBoundsParallelGaps(t *testing.T) {
+	t.Parallel()
+
+	dates := []string{"2024-07-08", "2024-07-09", "2024-07-10", "2024-07-11", "2024-07-12", "2024-07-13"}
+	logs := make([]map[string]interface{}, 0, len(dates))
+	plan := make([]Gap, 0, len(dates))
+	for i, dateStr := range dates {
+		logs = append(logs, lifelog(i+1, dateStr+"T10:00:00Z"))
+		d := mustParseDate(dateStr)
+		plan = append(plan, Gap{Start: d, End: d, Strategy: "daily"})
+	}
+	transport := api.NewInMemoryTransport(false)
+	transport.Seed(logs...)
+	backend := &slowReadBackend{Backend: NewMemoryBackend()}
+	manager := newFrozenManager(api.NewLimitlessAPI(transport), backend)
+
+	common := map[string]string{
+		"timezone": "UTC",
+		"limit":    "10",
+	}
+
+	const parallel = 5
+	result := manager.executeHybridPlan(plan, common, manager.executionDate(common), true, parallel)
+
+	for _, gap := range plan {
+		if len(result[core.FormatDate(gap.Start)]) != 1 {
+			t.Errorf("Expected 1 log for %s", core.FormatDate(gap.Start))
+		}
+	}
+	if peak := backend.peak.Load(); peak != parallel {
+		t.Errorf("Expected %d gaps in flight at peak, got %d", parallel, peak)
+	}
+}
+
+// delegationPlan pairs a three-day bulk gap with a single-day daily gap. It is
+// shared read-only; executeHybridPlan never modifies its plan.
+var delegationPlan = []Gap{
+	{Start: mustParseDate("2024-07-10"), End: mustParseDate("2024-07-12"), Strategy: "bulk"},
+	{Start: jul14, End: jul14, Strategy: "daily"},
+}
+
+// TestExecuteHybridPlanDelegatesByStrategy verifies that a bulk gap is fetched
+// with a single start/end request and a daily gap with one request per day.
+func TestExecuteHybridPlanDelegatesByStrategy(t *testing.T) {
+	t.Parallel()
+
+	transport, _, manager := newFrozenTestManager(
+		lifelog(1, "2024-07-10T10:00:00Z"),
+		lifelog(2, "2024-07-12T10:00:00Z"),
+		lifelog(3, "2024-07-14T10:00:00Z"),
+	)
+
+	common := map[string]string{
+		"timezone": "UTC",
+		"limit":    "10",
+	}
+
+	result := manager.executeHybridPlan(delegationPlan, common, frozenNow, true, 2)
+	for _, dateStr := range []string{"2024-07-10", "2024-07-12", "2024-07-14"} {
+		if len(result[dateStr]) != 1 {
+			t.Errorf("Expected 1 log for %s, got %d", dateStr, len(result[dateStr]))
+		}
+	}
+
+	// Requests by kind: [bulk, daily]
+	var calls [2]int
+	var bulkParams, dailyParams map[string]string
+	for _, req := range transport.RequestLog {
+		if req.Params["date"] != "" {
+			calls[1]++
+			dailyParams = req.Params
+		} else {
+			calls[0]++
+			bulkParams = req.Params
+		}
+	}
+
+	if calls != [2]int{1, 1} {
+		t.Fatalf("Expected exactly 1 bulk and 1 daily request, got %v", calls)
+	}
+	if bulkParams["start"] != "2024-07-10 00:00:00" || bulkParams["end"] != "2024-07-12 23:59:59" {
+		t.Errorf("Expected bulk request over 2024-07-10..2024-07-12, got %v", bulkParams)
+	}
+	if dailyParams["date"] != "2024-07-14" {
+		t.Errorf("Expected daily request for 2024-07-14, got %v", dailyParams)
+	}
+}
+
+// TestBulkWritesReuseMemoizedScan verifies that cache writes update the
+// memoized scan instead of discarding it, so a bulk fetch scans only once.
+func TestBulkWritesReuseMemoizedScan(t *testing.T) {
+	transport := api.NewInMemoryTransport(false)
+	transport.Seed(
+		lifelog(1, "2024-07-14T10:00:00Z"),
+		lifelog(2, "2024-07-15T10:00:00Z"),
+		lifelog(3, "2024-07-16T10:00:00Z"),
+	)
+
+	limitlessAPI := api.NewLimitlessAPI(transport)
+	backend := &countingBackend{Backend: NewMemoryBackend()}
+	manager := NewManager(limitlessAPI, backend, false)
+
+	setFetchStrategy(t, core.FetchStrategyBulk)
+
+	start := jul14
+	end := jul16
+
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+		"limit":     "10",
+	}
+
+	for range manager.StreamRange(start, end, common, 0, true, false, 1) {
+	}
+
+	if backend.scans.Load() != 1 {
+		t.Errorf("Expected 1 cache scan for a bulk fetch, got %d", backend.scans.Load())
+	}
+	// One write per fetched day, then the two confirmation upgrades
+	if backend.writes.Load() != 5 {
+		t.Errorf("Expected 5 cache writes, got %d", backend.writes.Load())
+	}
+
+	// Earlier days are stamped with the latest day that has data
+	for _, dateStr := range []string{"2024-07-14", "2024-07-15"} {
+		d, _ := time.Parse(core.APIDateFmt, dateStr)
+		entry := backend.Read(d)
+		if entry == nil || entry.ConfirmedCompleteUpToDate == nil || *entry.ConfirmedCompleteUpToDate != "2024-07-16" {
+			t.Errorf("Expected %s to be confirmed up to 2024-07-16", dateStr)
+		}
+	}
+}
+
+// TestHybridFillReadsOnlyDaysWithLogs verifies that filling a range from
+// cache skips the days the scan shows are empty.
+func TestHybridFillReadsOnlyDaysWithLogs(t *testing.T) {
+	memory := NewMemoryBackend()
+	confirmedDate := "2024-07-15"
+	for _, dateStr := range []string{"2024-07-12", "2024-07-13", "2024-07-14"} {
+		logs := []map[string]interface{}{}
+		if dateStr != "2024-07-13" {
+			logs = append(logs, map[string]interface{}{"id": dateStr})
+		}
+		memory.Seed(&CacheEntry{
+			Logs:                      logs,
+			DataDate:                  dateStr,
+			FetchedOnDate:             dateStr,
+			ConfirmedCompleteUpToDate: &confirmedDate,
+		})
+	}
+	backend := &countingBackend{Backend: memory}
+	limitlessAPI := api.NewLimitlessAPI(api.NewInMemoryTransport(false))
+	manager := newFrozenManager(limitlessAPI, backend)
+
+	setFetchStrategy(t, core.FetchStrategyHybrid)
+
+	start := mustParseDate("2024-07-12")
+	end := jul14
+
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+	}
+
+	logs := make([]map[string]interface{}, 0)
+	for log := range manager.StreamRange(start, end, common, 0, true, false, 1) {
+		logs = append(logs, log)
+	}
+
+	if got := logIDs(logs); got != "[2024-07-12 2024-07-14]" {
+		t.Errorf("Expected cached logs for both non-empty days, got %s", got)
+	}
+	// One read for the probe short-circuit, then two to fill the non-empty
+	// days; planning works from the scan alone
+	if backend.reads.Load() != 3 {
+		t.Errorf("Expected 3 cache reads, got %d", backend.reads.Load())
+	}
+}
+
+// TestHybridFillReadsDaysMissingFromScan verifies that a day the
+// confirmed-day bitmap vouches for is served from cache even when the
+// memoized scan predates its entry.
+func TestHybridFillReadsDaysMissingFromScan(t *testing.T) {
+	_, backend, manager := newFrozenTestManager()
+
+	setFetchStrategy(t, core.FetchStrategyHybrid)
+
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+	}
+
+	// Memoize a scan, then write the entry behind the Manager's back
+	manager.scanCacheDirectory(manager.executionDate(common))
+	confirmedDate := "2024-07-14"
+	backend.Seed(&CacheEntry{
+		Logs:                      []map[string]interface{}{lifelog(1, "2024-07-13T10:00:00Z")},
+		DataDate:                  "2024-07-13",
+		FetchedOnDate:             "2024-07-14",
+		ConfirmedCompleteUpToDate: &confirmedDate,
+	})
+	manager.confirmedDays.set(jul13)
+
+	logs := make([]map[string]interface{}, 0)
+	for log := range manager.StreamRange(jul13, jul13, common, 0, true, false, 1) {
+		logs = append(logs, log)
+	}
+
+	if got := logIDs(logs); got != "[1]" {
+		t.Errorf("Expected the cached log for the skipped day, got %s", got)
+	}
+}
+
+// TestHybridWarmRangeSkipsScanAndPlanning verifies that once a past range is
+// known confirmed, streaming it again reads each day once and nothing else.
+func TestHybridWarmRangeSkipsScanAndPlanning(t *testing.T) {
+	memory := NewMemoryBackend()
+	confirmedDate := "2024-07-14"
+	for i, dateStr := range []string{"2024-07-12", "2024-07-13"} {
+		memory.Seed(&CacheEntry{
+			Logs:                      []map[string]interface{}{lifelog(i+1, dateStr+"T10:00:00Z")},
+			DataDate:                  dateStr,
+			FetchedOnDate:             dateStr,
+			ConfirmedCompleteUpToDate: &confirmedDate,
+		})
+	}
+	backend := &countingBackend{Backend: memory}
+	manager := newFrozenManager(api.NewLimitlessAPI(api.NewInMemoryTransport(false)), backend)
+
+	setFetchStrategy(t, core.FetchStrategyHybrid)
+
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+	}
+	start := mustParseDate("2024-07-12")
+
+	// The first run plans from the scan and records both days as confirmed
+	takeLogs(t, manager.StreamRange(start, jul13, common, 0, true, false, 1), 2)
+	if !manager.confirmedDays.hasRange(start, jul13) {
+		t.Fatal("Expected planning to mark the range confirmed")
+	}
+
+	reads, scans := backend.reads.Load(), backend.scans.Load()
+	if got := logIDs(takeLogs(t, manager.StreamRange(start, jul13, common, 0, true, false, 1), 2)); got != "[1 2]" {
+		t.Errorf("Expected both cached logs, got %s", got)
+	}
+	if n := backend.reads.Load() - reads; n != 2 {
+		t.Errorf("Expected one read per day on the warm run, got %d", n)
+	}
+	if backend.scans.Load() != scans {
+		t.Error("Expected no scan on the warm run")
+	}
+}
+
+// TestHybridWarmRangeFallsBackOnStaleBit verifies that a confirmed-day bit
+// whose entry has gone missing is cleared and the day fetched normally.
+func TestHybridWarmRangeFallsBackOnStaleBit(t *testing.T) {
+	_, backend, manager := newFrozenTestManager(
+		lifelog(1, "2024-07-12T10:00:00Z"),
+		lifelog(2, "2024-07-13T10:00:00Z"),
+	)
+
+	setFetchStrategy(t, core.FetchStrategyHybrid)
+
+	confirmedDate := "2024-07-14"
+	backend.Seed(&CacheEntry{
+		Logs:                      []map[string]interface{}{lifelog(2, "2024-07-13T10:00:00Z")},
+		DataDate:                  "2024-07-13",
+		FetchedOnDate:             "2024-07-14",
+		ConfirmedCompleteUpToDate: &confirmedDate,
+	})
+	start := mustParseDate("2024-07-12")
+	manager.confirmedDays.set(start) // stale: jul12 has no cache entry
+	manager.confirmedDays.set(jul13)
+
+	common := map[string]string{
+		"timezone":  "UTC",
+		"direction": "asc",
+		"limit":     "10",
+	}
+
+	if got := logIDs(takeLogs(t, manager.StreamRange(start, jul13, common, 0, true, false, 1), 2)); got != "[1 2]" {
+		t.Errorf("Expected the stale day to be fetched, got %s", got)
+	}
+	if backend.Read(start) == nil {
+		t.Error("Expected the fetched day to be cached")
+	}
+}
+
+func TestEmitLogsByDirection(t *testing.T) {
+	t.Parallel()
+
+	manager := NewManager(nil, NewMemoryBackend(), false)
+	logsByDay := map[string][]map[string]interface{}{
+		"2024-07-16": {{"id": 5}, {"id": 6}},
+		"2024-07-14": {{"id": 1}, {"id": 2}},
+		"2024-07-15": {{"id": 3}, {"id": 4}},
+	}
+
+	collect := func(direction string, maxResults int) string {
+		ch := make(chan map[string]interface{}, 6)
+		manager.emitLogsByDirection(ch, logsByDay, direction, maxResults)
+		close(ch)
+
+		logs := make([]map[string]interface{}, 0, 6)
+		for log := range ch {
+			logs = append(logs, log)
+		}
+		return logIDs(logs)
+	}
+
+	if got := collect("asc", 0); got != "[1 2 3 4 5 6]" {
+		t.Errorf("Expected ascending day order, got %s", got)
+	}
+	if got := collect("desc", 0); got != "[5 6 3 4 1 2]" {
+		t.Errorf("Expected descending day order with per-day order kept, got %s", got)
+	}
+	if got := collect("desc", 3); got != "[5 6 3]" {
+		t.Errorf("Expected emission to stop after 3 logs, got %s", got)
+	}
+	if got := collect("asc", 4); got != "[1 2 3 4]" {
+		t.Errorf("Expected emission to stop on a day boundary, got %s", got)
+	}
+}
+
+func TestDayRange(t *testing.T) {
+	t.Parallel()
+
+	start := time.Date(2024, 2, 27, 0, 0, 0, 0, time.UTC)
+	end := time.Date(2024, 3, 2, 0, 0, 0, 0, time.UTC)
+
+	days := dayRange(start, end)
+	got := make([]string, 0, len(days))
+	for _, d := range days {
+		got = append(got, core.FormatDate(d))
+	}
+	if fmt.Sprint(got) != "[2024-02-27 2024-02-28 2024-02-29 2024-03-01 2024-03-02]" {
+		t.Errorf("Expected inclusive range across leap day, got %v", got)
+	}
+
+	if days := dayRange(end, start); len(days) != 0 {
+		t.Errorf("Expected empty range when end precedes start, got %d days", len(days))
+	}
+}
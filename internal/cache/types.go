@@ -23,7 +23,8 @@
 // # Cache Validity Rules
 //
 // When not using --force-cache:
-//   - Today: Always re-fetch from API (today's data may be incomplete)
+//   - Today: Always re-fetch from API (today's data may be incomplete), except
+//     that a full fetch within the last core.TodayTTL is reused
 //   - Future dates: Skip entirely (return empty)
 //   - Past dates: Use cache ONLY if confirmed_complete_up_to_date > data_date
 //
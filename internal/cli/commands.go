@@ -6,8 +6,6 @@ import (
 	"strconv"
 	"time"
 
-	"github.com/colthorp/limitless-cli-go/internal/api"
-	"github.com/colthorp/limitless-cli-go/internal/cache"
 	"github.com/colthorp/limitless-cli-go/internal/core"
 	"github.com/colthorp/limitless-cli-go/internal/output"
 	"github.com/spf13/cobra"
@@ -112,9 +110,6 @@ func handleList(cmd *cobra.Command, args []string) error {
 
 	common := buildCommonParams(tzName, direction)
 
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
-	cm := cache.NewManager(limitlessAPI, nil, verbose)
-
 	if dateStr != "" || (startStr != "" && endStr != "") {
 		var startDate, endDate time.Time
 		var err error
@@ -142,22 +137,14 @@ func handleList(cmd *cobra.Command, args []string) error {
 			core.ProgressPrint(fmt.Sprintf("Processing logs from %s to %s…", core.FormatDate(startDate), core.FormatDate(endDate)), quiet)
 		}
 
-		maxResults := limit
-		logsCh := cm.StreamRange(startDate, endDate, common, maxResults, quiet, forceCache, parallel)
-
-		if raw {
-			output.StreamJSON(logsCh)
-		} else {
-			output.PrintMarkdown(logsCh)
-		}
+		runRange(startDate, endDate, common, parallel)
 	} else {
 		// Unbounded date range
 		if !quiet {
 			core.ProgressPrint("Fetching logs (unbounded date range)…", quiet)
 		}
 
-		client := api.NewClient("", verbose)
-		logsCh := client.Paginate("lifelogs", common, limit)
+		logsCh := getAPI(verbose).Paginate("lifelogs", common, limit)
 
 		if raw {
 			output.StreamJSON(logsCh)
@@ -174,8 +161,7 @@ func handleGetByID(cmd *cobra.Command, args []string) error {
 
 	core.Eprint(fmt.Sprintf("Fetching lifelog ID '%s'…", id), verbose)
 
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
-	result, err := limitlessAPI.FetchLifelogByID(id, includeMarkdown, includeHeadings)
+	result, err := getAPI(verbose).FetchLifelogByID(id, includeMarkdown, includeHeadings)
 	if err != nil {
 		return err
 	}
@@ -223,17 +209,7 @@ func handleGetDate(cmd *cobra.Command, args []string) error {
 
 	common := buildCommonParams(tzName, "desc")
 
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
-	cm := cache.NewManager(limitlessAPI, nil, verbose)
-
-	logsCh := cm.StreamRange(targetDate, targetDate, common, limit, quiet, forceCache, parallel)
-
-	if raw {
-		output.StreamJSON(logsCh)
-	} else {
-		output.PrintMarkdown(logsCh)
-	}
-
+	runRange(targetDate, targetDate, common, parallel)
 	return nil
 }
 
@@ -263,17 +239,7 @@ func handleWeek(cmd *cobra.Command, args []string) error {
 
 	common := buildCommonParams(tzName, direction)
 
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
-	cm := cache.NewManager(limitlessAPI, nil, verbose)
-
-	logsCh := cm.StreamRange(startDate, endDate, common, limit, quiet, forceCache, parallel)
-
-	if raw {
-		output.StreamJSON(logsCh)
-	} else {
-		output.PrintMarkdown(logsCh)
-	}
-
+	runRange(startDate, endDate, common, parallel)
 	return nil
 }
 
@@ -303,10 +269,7 @@ func handleRange(cmd *cobra.Command, args []string) error {
 
 	common := buildCommonParams(tzName, "asc")
 
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
-	cm := cache.NewManager(limitlessAPI, nil, verbose)
-
-	logsCh := cm.StreamRange(core.DateOnly(startDt), core.DateOnly(endDt), common, limit, quiet, forceCache, parallel)
+	logsCh := getCacheManager(verbose).StreamRange(core.DateOnly(startDt), core.DateOnly(endDt), common, limit, quiet, forceCache, parallel)
 
 	// Filter logs to the requested time range
 	filteredLogs := make([]map[string]interface{}, 0)
@@ -353,22 +316,24 @@ func handleTimeRelative(cmd *cobra.Command, period string) error {
 
 	common := buildCommonParams(tzName, "asc")
 
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
-	cm := cache.NewManager(limitlessAPI, nil, verbose)
+	runRange(core.DateOnly(startDt), core.DateOnly(endDt), common, parallel)
+	return nil
+}
+
+func handleMCP(cmd *cobra.Command, args []string) error {
+	return runMCPServer()
+}
 
-	logsCh := cm.StreamRange(core.DateOnly(startDt), core.DateOnly(endDt), common, limit, quiet, forceCache, parallel)
+// runRange streams logs for the inclusive date range through the shared cache
+// manager and writes them in the selected output format.
+func runRange(startDate, endDate time.Time, common map[string]string, parallel int) {
+	logsCh := getCacheManager(verbose).StreamRange(startDate, endDate, common, limit, quiet, forceCache, parallel)
 
 	if raw {
 		output.StreamJSON(logsCh)
 	} else {
 		output.PrintMarkdown(logsCh)
 	}
-
-	return nil
-}
-
-func handleMCP(cmd *cobra.Command, args []string) error {
-	return runMCPServer()
 }
 
 // buildCommonParams creates the common API parameters map.
@@ -0,0 +1,56 @@
+package cli
+
+import (
+	"sync"
+
+	"github.com/colthorp/limitless-cli-go/internal/api"
+	"github.com/colthorp/limitless-cli-go/internal/cache"
+)
+
+// Process-wide API clients and cache managers, one per verbosity setting.
+// Reusing them keeps HTTP keep-alive connections and the Manager's scan and
+// confirmation state warm when one process serves many requests.
+var (
+	sharedLock     sync.Mutex
+	sharedAPIs     = make(map[bool]*api.LimitlessAPI)
+	sharedManagers = make(map[bool]*cache.Manager)
+)
+
+// getAPI returns the shared LimitlessAPI for the given verbosity.
+func getAPI(verbose bool) *api.LimitlessAPI {
+	sharedLock.Lock()
+	defer sharedLock.Unlock()
+	return sharedAPILocked(verbose)
+}
+
+// getCacheManager returns the shared cache Manager for the given verbosity.
+func getCacheManager(verbose bool) *cache.Manager {
+	sharedLock.Lock()
+	defer sharedLock.Unlock()
+
+	if cm, ok := sharedManagers[verbose]; ok {
+		return cm
+	}
+	cm := cache.NewManager(sharedAPILocked(verbose), nil, verbose)
+	sharedManagers[verbose] = cm
+	return cm
+}
+
+// sharedAPILocked returns the shared LimitlessAPI; sharedLock must be held.
+func sharedAPILocked(verbose bool) *api.LimitlessAPI {
+	if limitlessAPI, ok := sharedAPIs[verbose]; ok {
+		return limitlessAPI
+	}
+	limitlessAPI := api.NewLimitlessAPIWithVerbose(verbose)
+	sharedAPIs[verbose] = limitlessAPI
+	return limitlessAPI
+}
+
+// resetShared forgets all shared instances. Later getters create fresh ones.
+func resetShared() {
+	sharedLock.Lock()
+	defer sharedLock.Unlock()
+
+	clear(sharedManagers)
+	clear(sharedAPIs)
+}
@@ -0,0 +1,28 @@
+package cli
+
+import (
+	"testing"
+
+	"github.com/colthorp/limitless-cli-go/internal/core"
+)
+
+func TestSharedCacheManager(t *testing.T) {
+	t.Setenv(core.APIKeyEnvVar, "test-key")
+	defer resetShared()
+
+	cm := getCacheManager(false)
+	if getCacheManager(false) != cm {
+		t.Error("Expected repeated calls to return the shared manager")
+	}
+	if getCacheManager(true) == cm {
+		t.Error("Expected a separate manager for verbose output")
+	}
+	if getAPI(false) != getAPI(false) {
+		t.Error("Expected repeated calls to return the shared API")
+	}
+
+	resetShared()
+	if getCacheManager(false) == cm {
+		t.Error("Expected a fresh manager after resetShared")
+	}
+}
@@ -3,12 +3,12 @@ package cli
 import (
 	"bufio"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"os"
+	"strings"
 	"time"
 
-	"github.com/colthorp/limitless-cli-go/internal/api"
-	"github.com/colthorp/limitless-cli-go/internal/cache"
 	"github.com/colthorp/limitless-cli-go/internal/core"
 )
 
@@ -71,6 +71,8 @@ type FetchRangeParams struct {
 
 // runMCPServer starts the MCP server on stdio
 func runMCPServer() error {
+	defer resetShared()
+
 	scanner := bufio.NewScanner(os.Stdin)
 	// Increase buffer size for large messages
 	const maxCapacity = 10 * 1024 * 1024 // 10MB
@@ -261,9 +263,8 @@ func handleFetchDay(id interface{}, argsJSON json.RawMessage) {
 		return
 	}
 
-	// Set up API and cache manager
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(false)
-	cm := cache.NewManager(limitlessAPI, nil, false)
+	// Reuse the process-wide cache manager across tool calls
+	cm := getCacheManager(false)
 
 	// Prepare common parameters
 	common := map[string]string{
@@ -349,9 +350,8 @@ func handleFetchRange(id interface{}, argsJSON json.RawMessage) {
 		return
 	}
 
-	// Set up API and cache manager
-	limitlessAPI := api.NewLimitlessAPIWithVerbose(false)
-	cm := cache.NewManager(limitlessAPI, nil, false)
+	// Reuse the process-wide cache manager across tool calls
+	cm := getCacheManager(false)
 
 	// Prepare common parameters
 	common := map[string]string{
@@ -368,17 +368,17 @@ func handleFetchRange(id interface{}, argsJSON json.RawMessage) {
 	// Fetch logs
 	logsCh := cm.StreamRange(core.DateOnly(startDt), core.DateOnly(endDt), common, 0, true, false, 1)
 
-	// Filter logs to requested time range
+	// Filter logs to requested time range, formatting each kept log as it
+	// arrives so the raw and formatted lists are never both held in full
 	filteredLogs := make([]map[string]interface{}, 0)
 	for log := range logsCh {
-		if core.LogOverlapsRange(log, startDt, endDt, loc) {
-			filteredLogs = append(filteredLogs, log)
+		if !core.LogOverlapsRange(log, startDt, endDt, loc) {
+			continue
 		}
-	}
-
-	formattedLogs := filteredLogs
-	if !args.Raw {
-		formattedLogs = formatLogsForDisplay(filteredLogs)
+		if !args.Raw {
+			log = formatLogForDisplay(log)
+		}
+		filteredLogs = append(filteredLogs, log)
 	}
 
 	result := map[string]interface{}{
@@ -386,20 +386,35 @@ func handleFetchRange(id interface{}, argsJSON json.RawMessage) {
 		"end_datetime":   endDt.Format("2006-01-02 15:04:05"),
 		"timezone":       args.Timezone,
 		"logs_count":     len(filteredLogs),
-		"logs":           formattedLogs,
+		"logs":           filteredLogs,
 	}
 
 	sendToolResult(id, result)
 }
 
+// errInvalidDateSpec is returned for date specs that are neither a shorthand
+// nor shaped like a YYYY-MM-DD date.
+var errInvalidDateSpec = errors.New("invalid date specification")
+
 func parseDateSpec(dateSpec string, loc *time.Location) (time.Time, error) {
-	switch dateSpec {
-	case "today":
-		return core.DateOnly(time.Now().In(loc)), nil
-	case "yesterday":
-		return core.DateOnly(time.Now().In(loc).AddDate(0, 0, -1)), nil
+	return parseDateSpecAt(dateSpec, loc, time.Now())
+}
+
+// parseDateSpecAt resolves "today" and "yesterday" against a single reading
+// of now in loc. Surrounding space and letter case are ignored; TrimSpace
+// and EqualFold compare in place, so no normalized copy of the spec is made.
+func parseDateSpecAt(dateSpec string, loc *time.Location, now time.Time) (time.Time, error) {
+	key := strings.TrimSpace(dateSpec)
+	switch {
+	case strings.EqualFold(key, "today"):
+		return core.DateOnly(now.In(loc)), nil
+	case strings.EqualFold(key, "yesterday"):
+		return core.DateOnly(now.In(loc)).Add(-24 * time.Hour), nil
+	case len(key) != len(core.APIDateFmt) || key[4] != '-' || key[7] != '-':
+		// Not shaped like YYYY-MM-DD; reject without a failed parse
+		return time.Time{}, errInvalidDateSpec
 	default:
-		return core.ParseDate(dateSpec)
+		return core.ParseDate(key)
 	}
 }
 
@@ -407,35 +422,40 @@ func formatLogsForDisplay(logs []map[string]interface{}) []map[string]interface{
 	formatted := make([]map[string]interface{}, 0, len(logs))
 
 	for _, log := range logs {
-		formattedLog := map[string]interface{}{
-			"id":         log["id"],
-			"title":      log["title"],
-			"start_time": log["startTime"],
-			"end_time":   log["endTime"],
-			"markdown":   log["markdown"],
-		}
+		formatted = append(formatted, formatLogForDisplay(log))
+	}
 
-		// Include content summary if available
-		if contents, ok := log["contents"].([]interface{}); ok && len(contents) > 0 {
-			summary := map[string]interface{}{
-				"sections": len(contents),
-			}
-			if first, ok := contents[0].(map[string]interface{}); ok {
-				summary["first_section_type"] = first["type"]
-				if content, ok := first["content"].(string); ok {
-					if len(content) > 200 {
-						content = content[:200] + "..."
-					}
-					summary["preview"] = content
+	return formatted
+}
+
+// formatLogForDisplay returns the display form of a single log.
+func formatLogForDisplay(log map[string]interface{}) map[string]interface{} {
+	formattedLog := map[string]interface{}{
+		"id":         log["id"],
+		"title":      log["title"],
+		"start_time": log["startTime"],
+		"end_time":   log["endTime"],
+		"markdown":   log["markdown"],
+	}
+
+	// Include content summary if available
+	if contents, ok := log["contents"].([]interface{}); ok && len(contents) > 0 {
+		summary := map[string]interface{}{
+			"sections": len(contents),
+		}
+		if first, ok := contents[0].(map[string]interface{}); ok {
+			summary["first_section_type"] = first["type"]
+			if content, ok := first["content"].(string); ok {
+				if len(content) > 200 {
+					content = content[:200] + "..."
 				}
+				summary["preview"] = content
 			}
-			formattedLog["content_summary"] = summary
 		}
-
-		formatted = append(formatted, formattedLog)
+		formattedLog["content_summary"] = summary
 	}
 
-	return formatted
+	return formattedLog
 }
 
 func sendResponse(id interface{}, result interface{}) {
@@ -8,24 +8,30 @@ import (
 	"github.com/colthorp/limitless-cli-go/internal/core"
 )
 
-func TestParseDateSpec(t *testing.T) {
-	loc := time.UTC
+// Fixed clock shared by the date spec tests.
+var mcpTestNow = time.Date(2024, 7, 15, 12, 0, 0, 0, time.UTC)
 
+func TestParseDateSpec(t *testing.T) {
 	tests := []struct {
 		name    string
 		input   string
 		want    string
 		wantErr bool
 	}{
-		{"today", "today", time.Now().In(loc).Format(core.APIDateFmt), false},
-		{"yesterday", "yesterday", time.Now().In(loc).AddDate(0, 0, -1).Format(core.APIDateFmt), false},
+		{"today", "today", "2024-07-15", false},
+		{"yesterday", "yesterday", "2024-07-14", false},
+		{"mixed case", " Today ", "2024-07-15", false},
+		{"upper case", "TODAY", "2024-07-15", false},
+		{"mixed case yesterday", "YesterDay", "2024-07-14", false},
 		{"exact date", "2024-07-15", "2024-07-15", false},
+		{"padded date", " 2024-07-15\n", "2024-07-15", false},
 		{"invalid", "invalid-date", "", true},
+		{"invalid date", "2024-02-30", "", true},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got, err := parseDateSpec(tt.input, loc)
+			got, err := parseDateSpecAt(tt.input, time.UTC, mcpTestNow)
 			if (err != nil) != tt.wantErr {
 				t.Errorf("parseDateSpec(%q) error = %v, wantErr %v", tt.input, err, tt.wantErr)
 				return
@@ -84,6 +90,20 @@ func TestFormatLogsForDisplay(t *testing.T) {
 	}
 }
 
+func TestFormatLogForDisplayWithoutContents(t *testing.T) {
+	log := formatLogForDisplay(map[string]interface{}{
+		"id":        "test-id",
+		"startTime": "2024-07-15T10:00:00Z",
+	})
+
+	if log["id"] != "test-id" || log["start_time"] != "2024-07-15T10:00:00Z" {
+		t.Errorf("Expected id and start_time to be copied, got %v", log)
+	}
+	if _, ok := log["content_summary"]; ok {
+		t.Error("Expected no content_summary for a log without contents")
+	}
+}
+
 func TestMCPRequestParsing(t *testing.T) {
 	// Test initialize request
 	initReq := `{"jsonrpc":"2.0","id":1,"method":"initialize","params":{}}`
@@ -4,6 +4,7 @@ package core
 import (
 	"os"
 	"path/filepath"
+	"time"
 )
 
 // API configuration
@@ -20,6 +21,13 @@ const (
 	APIDatetimeFmt = "2006-01-02 15:04:05"
 )
 
+// Times of day appended to an APIDateFmt date to form the inclusive
+// APIDatetimeFmt bounds of that day
+const (
+	DayStartSuffix = " 00:00:00"
+	DayEndSuffix   = " 23:59:59"
+)
+
 // Pagination
 const (
 	PageLimit = 10
@@ -42,6 +50,10 @@ const (
 	HybridMaxWorkers  = 3   // Max parallel workers for hybrid gaps
 )
 
+// Today is normally re-fetched on every request; a full fetch made within
+// this window is reused instead (matters for repeated MCP tool calls).
+const TodayTTL = 60 * time.Second
+
 // Backward compatibility flags
 var UseBulkRangePagination = false
 
@@ -6,6 +6,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -23,17 +24,42 @@ func ProgressPrint(msg string, quiet bool) {
 	}
 }
 
+// tzCache memoizes GetTZ by timezone name. time.LoadLocation reads the zone
+// file on every call, so each name is loaded once per process; failed lookups
+// are cached as UTC so the fallback warning is printed only once. UTC is
+// built in and seeded up front; DefaultTZ is left to load on first use so
+// that startup does no zoneinfo I/O.
+var (
+	tzCacheLock sync.RWMutex
+	tzCache     = map[string]*time.Location{"UTC": time.UTC}
+)
+
 // GetTZ returns a *time.Location for the given timezone name.
 // Falls back to UTC if the timezone is not found.
 func GetTZ(name string) *time.Location {
 	if name == "" {
 		name = DefaultTZ
 	}
+
+	tzCacheLock.RLock()
+	loc, ok := tzCache[name]
+	tzCacheLock.RUnlock()
+	if ok {
+		return loc
+	}
+
+	tzCacheLock.Lock()
+	defer tzCacheLock.Unlock()
+
+	if loc, ok := tzCache[name]; ok {
+		return loc
+	}
 	loc, err := time.LoadLocation(name)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "Warning: Timezone '%s' not found; falling back to UTC.\n", name)
-		return time.UTC
+		loc = time.UTC
 	}
+	tzCache[name] = loc
 	return loc
 }
 
@@ -49,7 +75,14 @@ func GetAPIKey() string {
 }
 
 // ParseDate parses a YYYY-MM-DD string into a time.Time (date only, at midnight UTC).
+// Well-formed input is read digit by digit; anything else falls through to
+// time.Parse so the accepted forms are unchanged.
 func ParseDate(s string) (time.Time, error) {
+	if len(s) == len(APIDateFmt) {
+		if t, ok := ParseDayPrefix(s); ok {
+			return t, nil
+		}
+	}
 	t, err := time.Parse(APIDateFmt, s)
 	if err != nil {
 		return time.Time{}, fmt.Errorf("invalid date '%s' (expected YYYY-MM-DD)", s)
@@ -57,8 +90,155 @@ func ParseDate(s string) (time.Time, error) {
 	return t, nil
 }
 
+// ParseDayPrefix returns the calendar date (midnight UTC) from the leading
+// YYYY-MM-DD of a date or timestamp string such as "2024-07-15T10:00:00Z".
+// It reads the fixed-width digits directly instead of going through time.Parse,
+// since it runs once per log when bulk results are grouped by day.
+func ParseDayPrefix(s string) (time.Time, bool) {
+	year, month, day, ok := parseYMD(s)
+	if !ok {
+		return time.Time{}, false
+	}
+	return time.Date(year, time.Month(month), day, 0, 0, 0, 0, time.UTC), true
+}
+
+// parseYMD extracts and validates the YYYY-MM-DD prefix of s.
+func parseYMD(s string) (year, month, day int, ok bool) {
+	if len(s) < 10 || s[4] != '-' || s[7] != '-' {
+		return 0, 0, 0, false
+	}
+	year, ok1 := parseDigits(s[0:4])
+	month, ok2 := parseDigits(s[5:7])
+	day, ok3 := parseDigits(s[8:10])
+	if !ok1 || !ok2 || !ok3 || month < 1 || month > 12 || day < 1 || day > daysInMonth(year, month) {
+		return 0, 0, 0, false
+	}
+	return year, month, day, true
+}
+
+// parseHMS extracts and validates the HH:MM:SS that follows a YYYY-MM-DD
+// date and a single space in s.
+func parseHMS(s string) (hour, minute, second int, ok bool) {
+	if len(s) < 19 || s[10] != ' ' || s[13] != ':' || s[16] != ':' {
+		return 0, 0, 0, false
+	}
+	hour, ok1 := parseDigits(s[11:13])
+	minute, ok2 := parseDigits(s[14:16])
+	second, ok3 := parseDigits(s[17:19])
+	if !ok1 || !ok2 || !ok3 || hour > 23 || minute > 59 || second > 59 {
+		return 0, 0, 0, false
+	}
+	return hour, minute, second, true
+}
+
+// parseDigits parses a string made up solely of ASCII digits.
+func parseDigits(s string) (int, bool) {
+	n := 0
+	for i := 0; i < len(s); i++ {
+		c := s[i] - '0'
+		if c > 9 {
+			return 0, false
+		}
+		n = n*10 + int(c)
+	}
+	return n, true
+}
+
+// daysInMonth returns the number of days in the given month. Outside February
+// the month lengths alternate 31/30 with the parity flipping after July, which
+// (month + month>>3) & 1 captures without a table.
+func daysInMonth(year, month int) int {
+	if month == 2 {
+		if year%4 == 0 && (year%100 != 0 || year%400 == 0) {
+			return 29
+		}
+		return 28
+	}
+	return 30 + (month+month>>3)&1
+}
+
+// addMonths shifts a (year, month) pair by delta months.
+func addMonths(year, month, delta int) (int, int) {
+	total := year*12 + (month - 1) + delta
+	y, m := total/12, total%12
+	if m < 0 {
+		y, m = y-1, m+12
+	}
+	return y, m + 1
+}
+
+// relativeDelta moves the calendar date (year, month, day) back by num units,
+// where unit is one of 'd', 'w', 'm' or 'y'. It works purely on integers:
+// day and week shifts go through a day count, and month and year shifts
+// clamp the day to the length of the target month (so Mar 31 minus one
+// month is the end of Feb).
+func relativeDelta(unit byte, num, year, month, day int) (int, int, int) {
+	switch unit {
+	case 'd':
+		return civilFromDays(daysFromCivil(year, month, day) - num)
+	case 'w':
+		return civilFromDays(daysFromCivil(year, month, day) - num*7)
+	case 'y':
+		num *= 12
+	}
+	year, month = addMonths(year, month, -num)
+	return year, month, min(day, daysInMonth(year, month))
+}
+
+// daysFromCivil returns the number of days from 1970-01-01 to the given
+// proleptic Gregorian date. Years are counted from March so February, and
+// with it the leap day, falls last; the remaining months then follow the
+// 153-days-per-5-months pattern.
+func daysFromCivil(year, month, day int) int {
+	if month <= 2 {
+		year--
+	}
+	era := year
+	if era < 0 {
+		era -= 399
+	}
+	era /= 400
+	yearOfEra := year - era*400
+	dayOfYear := (153*((month+9)%12)+2)/5 + day - 1
+	dayOfEra := yearOfEra*365 + yearOfEra/4 - yearOfEra/100 + dayOfYear
+	return era*146097 + dayOfEra - 719468
+}
+
+// civilFromDays is the inverse of daysFromCivil.
+func civilFromDays(days int) (int, int, int) {
+	days += 719468
+	era := days
+	if era < 0 {
+		era -= 146096
+	}
+	era /= 146097
+	dayOfEra := days - era*146097
+	yearOfEra := (dayOfEra - dayOfEra/1460 + dayOfEra/36524 - dayOfEra/146096) / 365
+	dayOfYear := dayOfEra - (365*yearOfEra + yearOfEra/4 - yearOfEra/100)
+	mp := (5*dayOfYear + 2) / 153
+	day := dayOfYear - (153*mp+2)/5 + 1
+	month := mp + 3
+	if month > 12 {
+		month -= 12
+	}
+	year := yearOfEra + era*400
+	if month <= 2 {
+		year++
+	}
+	return year, month, day
+}
+
 // ParseDatetime parses a "YYYY-MM-DD HH:MM:SS" string in the given timezone.
+// As with ParseDate, the fixed-width form skips time.ParseInLocation.
 func ParseDatetime(s string, loc *time.Location) (time.Time, error) {
+	if len(s) == len(APIDatetimeFmt) {
+		year, month, day, ok := parseYMD(s)
+		if ok {
+			if hour, minute, second, ok := parseHMS(s); ok {
+				return time.Date(year, time.Month(month), day, hour, minute, second, 0, loc), nil
+			}
+		}
+	}
 	t, err := time.ParseInLocation(APIDatetimeFmt, s, loc)
 	if err != nil {
 		return time.Time{}, fmt.Errorf("invalid datetime '%s' (expected YYYY-MM-DD HH:MM:SS)", s)
@@ -66,47 +246,56 @@ func ParseDatetime(s string, loc *time.Location) (time.Time, error) {
 	return t, nil
 }
 
+// Date and week spec patterns, compiled once at package load.
+var (
+	monthDayRegex = regexp.MustCompile(`^(\d{1,2})/(\d{1,2})$`)
+	relativeRegex = regexp.MustCompile(`^([dwmy])-(\d+)$`)
+	weekNumRegex  = regexp.MustCompile(`^\d{1,2}$`)
+	isoWeekRegex  = regexp.MustCompile(`^(\d{4})-W(\d{2})$`)
+)
+
 // ParseDateSpec returns a concrete date for flexible spec strings.
 // Supports:
 // 1. Exact YYYY-MM-DD
 // 2. M/D or MM/DD (most recent past occurrence)
 // 3. Relative forms like d-7 (days), w-2 (weeks), m-3 (months), y-1 (years)
 func ParseDateSpec(spec string, loc *time.Location) (time.Time, error) {
-	now := time.Now().In(loc)
-	today := time.Date(now.Year(), now.Month(), now.Day(), 0, 0, 0, 0, loc)
-
-	// 1. YYYY-MM-DD
-	if t, err := time.Parse(APIDateFmt, spec); err == nil {
-		return t, nil
-	}
-
-	// 2. M/D or MM/DD
-	mdRegex := regexp.MustCompile(`^(\d{1,2})/(\d{1,2})$`)
-	if matches := mdRegex.FindStringSubmatch(spec); matches != nil {
-		month, _ := strconv.Atoi(matches[1])
-		day, _ := strconv.Atoi(matches[2])
-		target := time.Date(now.Year(), time.Month(month), day, 0, 0, 0, 0, loc)
-		if target.After(today) {
-			target = time.Date(now.Year()-1, time.Month(month), day, 0, 0, 0, 0, loc)
+	return ParseDateSpecAt(spec, loc, time.Now())
+}
+
+// ParseDateSpecAt is ParseDateSpec with relative forms resolved against now,
+// letting callers that resolve several specs share a single clock reading.
+func ParseDateSpecAt(spec string, loc *time.Location, now time.Time) (time.Time, error) {
+	now = now.In(loc)
+	today := startOfDay(now, loc)
+
+	// Classify the spec by shape first so each form is only tried by the
+	// parser that can accept it
+	switch {
+	case len(spec) == len(APIDateFmt) && spec[4] == '-' && spec[7] == '-':
+		// 1. YYYY-MM-DD
+		if t, err := ParseDate(spec); err == nil {
+			return t, nil
 		}
-		return target, nil
-	}
-
-	// 3. Relative d/w/m/y-N
-	relRegex := regexp.MustCompile(`^([dwmy])-(\d+)$`)
-	if matches := relRegex.FindStringSubmatch(strings.ToLower(spec)); matches != nil {
-		unit := matches[1]
-		num, _ := strconv.Atoi(matches[2])
-
-		switch unit {
-		case "d":
-			return today.AddDate(0, 0, -num), nil
-		case "w":
-			return today.AddDate(0, 0, -num*7), nil
-		case "m":
-			return today.AddDate(0, -num, 0), nil
-		case "y":
-			return today.AddDate(-num, 0, 0), nil
+
+	case strings.IndexByte(spec, '/') >= 0:
+		// 2. M/D or MM/DD
+		if matches := monthDayRegex.FindStringSubmatch(spec); matches != nil {
+			month, _ := strconv.Atoi(matches[1])
+			day, _ := strconv.Atoi(matches[2])
+			target := time.Date(now.Year(), time.Month(month), day, 0, 0, 0, 0, loc)
+			if target.After(today) {
+				target = time.Date(now.Year()-1, time.Month(month), day, 0, 0, 0, 0, loc)
+			}
+			return target, nil
+		}
+
+	case len(spec) >= 3 && spec[1] == '-':
+		// 3. Relative d/w/m/y-N
+		if matches := relativeRegex.FindStringSubmatch(strings.ToLower(spec)); matches != nil {
+			num, _ := strconv.Atoi(matches[2])
+			year, month, day := relativeDelta(matches[1][0], num, today.Year(), int(today.Month()), today.Day())
+			return time.Date(year, time.Month(month), day, 0, 0, 0, 0, loc), nil
 		}
 	}
 
@@ -115,11 +304,15 @@ func ParseDateSpec(spec string, loc *time.Location) (time.Time, error) {
 
 // ParseWeekSpec converts a week spec (N or YYYY-WNN) into (start_date, end_date).
 func ParseWeekSpec(spec string) (time.Time, time.Time, error) {
-	now := time.Now()
+	return ParseWeekSpecAt(spec, time.Now())
+}
+
+// ParseWeekSpecAt is ParseWeekSpec with bare week numbers taken from the
+// year of now.
+func ParseWeekSpecAt(spec string, now time.Time) (time.Time, time.Time, error) {
 	currentYear := now.Year()
 
 	// 1. Integer week number (assume current year)
-	weekNumRegex := regexp.MustCompile(`^\d{1,2}$`)
 	if weekNumRegex.MatchString(spec) {
 		weekNum, _ := strconv.Atoi(spec)
 		if weekNum < 1 || weekNum > 53 {
@@ -129,7 +322,6 @@ func ParseWeekSpec(spec string) (time.Time, time.Time, error) {
 	}
 
 	// 2. YYYY-WNN format
-	isoWeekRegex := regexp.MustCompile(`^(\d{4})-W(\d{2})$`)
 	if matches := isoWeekRegex.FindStringSubmatch(spec); matches != nil {
 		year, _ := strconv.Atoi(matches[1])
 		weekNum, _ := strconv.Atoi(matches[2])
@@ -145,16 +337,16 @@ func ParseWeekSpec(spec string) (time.Time, time.Time, error) {
 // weekDates returns the start (Monday) and end (Sunday) dates for a given ISO week.
 func weekDates(year, week int) (time.Time, time.Time, error) {
 	// Find January 4th of the year (always in week 1 per ISO 8601)
-	jan4 := time.Date(year, time.January, 4, 0, 0, 0, 0, time.UTC)
-	// Find the Monday of that week
-	weekday := int(jan4.Weekday())
-	if weekday == 0 {
-		weekday = 7 // Sunday = 7
+	jan4 := daysFromCivil(year, 1, 4)
+	// Days since Monday; day 0 (1970-01-01) was a Thursday
+	weekday := (jan4 + 3) % 7
+	if weekday < 0 {
+		weekday += 7
 	}
-	mondayWeek1 := jan4.AddDate(0, 0, -(weekday - 1))
 	// Calculate the Monday of the target week
-	startDate := mondayWeek1.AddDate(0, 0, (week-1)*7)
-	endDate := startDate.AddDate(0, 0, 6)
+	monday := jan4 - weekday + (week-1)*7
+	startDate := time.Unix(int64(monday)*86400, 0).UTC()
+	endDate := startDate.Add(6 * 24 * time.Hour)
 	return startDate, endDate, nil
 }
 
@@ -162,75 +354,84 @@ func weekDates(year, week int) (time.Time, time.Time, error) {
 // Supported periods: today, yesterday, this-week, last-week, this-month,
 // last-month, this-quarter, last-quarter.
 func GetTimeRange(period string, loc *time.Location) (time.Time, time.Time, error) {
-	now := time.Now().In(loc)
-	today := time.Date(now.Year(), now.Month(), now.Day(), 0, 0, 0, 0, loc)
+	return GetTimeRangeAt(period, loc, time.Now())
+}
 
-	startOfDay := func(t time.Time) time.Time {
-		return time.Date(t.Year(), t.Month(), t.Day(), 0, 0, 0, 0, loc)
-	}
-	endOfDay := func(t time.Time) time.Time {
-		return time.Date(t.Year(), t.Month(), t.Day(), 23, 59, 59, 999999999, loc)
+// GetTimeRangeAt is GetTimeRange with the period taken relative to now.
+func GetTimeRangeAt(period string, loc *time.Location, now time.Time) (time.Time, time.Time, error) {
+	periodRange, ok := periodRanges[period]
+	if !ok {
+		return time.Time{}, time.Time{}, fmt.Errorf("unknown period: %s", period)
 	}
+	start, end := periodRange(startOfDay(now.In(loc), loc), loc)
+	return start, end, nil
+}
 
-	switch period {
-	case "today":
-		return startOfDay(today), endOfDay(today), nil
-
-	case "yesterday":
+// periodRanges maps each period supported by GetTimeRange to a function
+// computing its bounds from today (midnight in loc).
+var periodRanges = map[string]func(today time.Time, loc *time.Location) (time.Time, time.Time){
+	"today": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		return today, endOfDay(today, loc)
+	},
+	"yesterday": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
 		d := today.AddDate(0, 0, -1)
-		return startOfDay(d), endOfDay(d), nil
+		return startOfDay(d, loc), endOfDay(d, loc)
+	},
+	"this-week": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		return weekSpan(today, 0, loc)
+	},
+	"last-week": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		return weekSpan(today, 1, loc)
+	},
+	"this-month": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		return monthSpan(today.Year(), int(today.Month()), 1, loc)
+	},
+	"last-month": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		y, m := addMonths(today.Year(), int(today.Month()), -1)
+		return monthSpan(y, m, 1, loc)
+	},
+	"this-quarter": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		m := int(today.Month())
+		return monthSpan(today.Year(), m-(m-1)%3, 3, loc)
+	},
+	"last-quarter": func(today time.Time, loc *time.Location) (time.Time, time.Time) {
+		m := int(today.Month())
+		y, first := addMonths(today.Year(), m-(m-1)%3, -3)
+		return monthSpan(y, first, 3, loc)
+	},
+}
 
-	case "this-week":
-		// Week starts on Monday
-		weekday := int(today.Weekday())
-		if weekday == 0 {
-			weekday = 7
-		}
-		start := today.AddDate(0, 0, -(weekday - 1))
-		end := start.AddDate(0, 0, 6)
-		return startOfDay(start), endOfDay(end), nil
-
-	case "last-week":
-		weekday := int(today.Weekday())
-		if weekday == 0 {
-			weekday = 7
-		}
-		startThisWeek := today.AddDate(0, 0, -(weekday - 1))
-		start := startThisWeek.AddDate(0, 0, -7)
-		end := start.AddDate(0, 0, 6)
-		return startOfDay(start), endOfDay(end), nil
-
-	case "this-month":
-		first := time.Date(now.Year(), now.Month(), 1, 0, 0, 0, 0, loc)
-		last := first.AddDate(0, 1, -1)
-		return startOfDay(first), endOfDay(last), nil
-
-	case "last-month":
-		first := time.Date(now.Year(), now.Month()-1, 1, 0, 0, 0, 0, loc)
-		last := first.AddDate(0, 1, -1)
-		return startOfDay(first), endOfDay(last), nil
-
-	case "this-quarter":
-		q := (int(now.Month()) - 1) / 3
-		firstMonth := time.Month(q*3 + 1)
-		first := time.Date(now.Year(), firstMonth, 1, 0, 0, 0, 0, loc)
-		last := first.AddDate(0, 3, -1)
-		return startOfDay(first), endOfDay(last), nil
-
-	case "last-quarter":
-		q := (int(now.Month()) - 1) / 3
-		var first time.Time
-		if q == 0 {
-			first = time.Date(now.Year()-1, time.October, 1, 0, 0, 0, 0, loc)
-		} else {
-			firstMonth := time.Month((q-1)*3 + 1)
-			first = time.Date(now.Year(), firstMonth, 1, 0, 0, 0, 0, loc)
-		}
-		last := first.AddDate(0, 3, -1)
-		return startOfDay(first), endOfDay(last), nil
+// startOfDay returns midnight at the start of t's calendar day in loc.
+func startOfDay(t time.Time, loc *time.Location) time.Time {
+	year, month, day := t.Date()
+	return time.Date(year, month, day, 0, 0, 0, 0, loc)
+}
+
+// endOfDay returns the last nanosecond of t's calendar day in loc.
+func endOfDay(t time.Time, loc *time.Location) time.Time {
+	year, month, day := t.Date()
+	return time.Date(year, month, day, 23, 59, 59, 999999999, loc)
+}
+
+// weekSpan returns the bounds of the Monday-to-Sunday week weeksAgo weeks
+// before the one containing today.
+func weekSpan(today time.Time, weeksAgo int, loc *time.Location) (time.Time, time.Time) {
+	weekday := int(today.Weekday())
+	if weekday == 0 {
+		weekday = 7
 	}
+	start := today.AddDate(0, 0, -(weekday-1)-7*weeksAgo)
+	end := start.AddDate(0, 0, 6)
+	return startOfDay(start, loc), endOfDay(end, loc)
+}
 
-	return time.Time{}, time.Time{}, fmt.Errorf("unknown period: %s", period)
+// monthSpan returns the start of the first day and the end of the last day of
+// the span of months months beginning at (year, month).
+func monthSpan(year, month, months int, loc *time.Location) (time.Time, time.Time) {
+	lastYear, lastMonth := addMonths(year, month, months-1)
+	start := time.Date(year, time.Month(month), 1, 0, 0, 0, 0, loc)
+	end := time.Date(lastYear, time.Month(lastMonth), daysInMonth(lastYear, lastMonth), 23, 59, 59, 999999999, loc)
+	return start, end
 }
 
 // LogOverlapsRange returns true when log overlaps with the [startDt, endDt] interval.
@@ -283,6 +484,18 @@ func DateOnly(t time.Time) time.Time {
 	return time.Date(t.Year(), t.Month(), t.Day(), 0, 0, 0, 0, time.UTC)
 }
 
+// DayIndex returns the number of days between the Unix epoch and t's
+// calendar date. It is a compact integer key for per-day maps and bitmaps.
+func DayIndex(t time.Time) int64 {
+	year, month, day := t.Date()
+	return int64(daysFromCivil(year, int(month), day))
+}
+
+// DayFromIndex returns the calendar date (midnight UTC) for a DayIndex value.
+func DayFromIndex(idx int64) time.Time {
+	return time.Unix(idx*86400, 0).UTC()
+}
+
 // FormatDate formats a time.Time as YYYY-MM-DD.
 func FormatDate(t time.Time) string {
 	return t.Format(APIDateFmt)
@@ -1,6 +1,7 @@
 package core
 
 import (
+	"fmt"
 	"testing"
 	"time"
 )
@@ -13,6 +14,9 @@ func TestParseDate(t *testing.T) {
 	}{
 		{"2024-07-15", "2024-07-15", false},
 		{"2023-01-01", "2023-01-01", false},
+		{"2024-02-29", "2024-02-29", false},
+		{"2023-02-29", "", true},
+		{"2024-07-1x", "", true},
 		{"invalid", "", true},
 		{"07/15/2024", "", true},
 	}
@@ -31,6 +35,39 @@ func TestParseDate(t *testing.T) {
 	}
 }
 
+func TestParseDayPrefix(t *testing.T) {
+	tests := []struct {
+		input  string
+		want   string
+		wantOK bool
+	}{
+		{"2024-07-15", "2024-07-15", true},
+		{"2024-07-15T10:00:00Z", "2024-07-15", true},
+		{"2024-02-29T23:59:59-04:00", "2024-02-29", true},
+		{"2023-02-29", "", false},
+		{"2024-13-01", "", false},
+		{"2024-7-15", "", false},
+		{"2024/07/15", "", false},
+		{"", "", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.input, func(t *testing.T) {
+			got, ok := ParseDayPrefix(tt.input)
+			if ok != tt.wantOK {
+				t.Errorf("ParseDayPrefix(%q) ok = %v, want %v", tt.input, ok, tt.wantOK)
+				return
+			}
+			if ok && got.Format(APIDateFmt) != tt.want {
+				t.Errorf("ParseDayPrefix(%q) = %v, want %v", tt.input, got.Format(APIDateFmt), tt.want)
+			}
+			if ok && got.Location() != time.UTC {
+				t.Errorf("ParseDayPrefix(%q) location = %v, want UTC", tt.input, got.Location())
+			}
+		})
+	}
+}
+
 func TestParseDatetime(t *testing.T) {
 	loc := time.UTC
 	tests := []struct {
@@ -40,6 +77,9 @@ func TestParseDatetime(t *testing.T) {
 	}{
 		{"2024-07-15 10:30:00", "2024-07-15 10:30:00", false},
 		{"2023-01-01 00:00:00", "2023-01-01 00:00:00", false},
+		{"2024-07-15 9:30:00", "2024-07-15 09:30:00", false},
+		{"2024-07-15 24:00:00", "", true},
+		{"2024-07-15T10:30:00", "", true},
 		{"invalid", "", true},
 		{"2024-07-15", "", true},
 	}
@@ -76,21 +116,23 @@ func TestParseDateSpec(t *testing.T) {
 		{"relative w-1", "w-1", today.AddDate(0, 0, -7).Format(APIDateFmt), false},
 		{"relative m-1", "m-1", today.AddDate(0, -1, 0).Format(APIDateFmt), false},
 		{"relative y-1", "y-1", today.AddDate(-1, 0, 0).Format(APIDateFmt), false},
+		{"month day", "7/4", "2024-07-04", false},
+		{"month day last year", "12/25", "2023-12-25", false},
+		{"uppercase relative", "D-2", "2024-07-13", false},
 		{"invalid", "invalid", "", true},
+		{"invalid date shape", "2024-13-01", "", true},
+		{"invalid relative unit", "x-1", "", true},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got, err := ParseDateSpec(tt.input, loc)
+			got, err := ParseDateSpecAt(tt.input, loc, now)
 			if (err != nil) != tt.wantErr {
 				t.Errorf("ParseDateSpec(%q) error = %v, wantErr %v", tt.input, err, tt.wantErr)
 				return
 			}
-			if !tt.wantErr {
-				// For relative dates, just check they're valid dates
-				if tt.input == "2024-07-15" && got.Format(APIDateFmt) != tt.want {
-					t.Errorf("ParseDateSpec(%q) = %v, want %v", tt.input, got.Format(APIDateFmt), tt.want)
-				}
+			if !tt.wantErr && got.Format(APIDateFmt) != tt.want {
+				t.Errorf("ParseDateSpec(%q) = %v, want %v", tt.input, got.Format(APIDateFmt), tt.want)
 			}
 		})
 	}
@@ -106,6 +148,9 @@ func TestParseWeekSpec(t *testing.T) {
 	}{
 		{"ISO week format", "2024-W01", "2024-01-01", "2024-01-07", false},
 		{"ISO week format W28", "2024-W28", "2024-07-08", "2024-07-14", false},
+		{"ISO week 1 starting after Jan 1", "2021-W01", "2021-01-04", "2021-01-10", false},
+		{"ISO week 53", "2020-W53", "2020-12-28", "2021-01-03", false},
+		{"ISO week 1 starting in prior year", "2025-W01", "2024-12-30", "2025-01-05", false},
 		{"invalid format", "invalid", "", "", true},
 		{"week out of range", "2024-W54", "", "", true},
 	}
@@ -164,6 +209,125 @@ func TestGetTimeRange(t *testing.T) {
 	}
 }
 
+func TestGetTimeRangeAt(t *testing.T) {
+	loc := time.UTC
+	// Wednesday of the first ISO week of 2024
+	now := time.Date(2024, 1, 10, 12, 0, 0, 0, loc)
+
+	tests := []struct {
+		period    string
+		wantStart string
+		wantEnd   string
+	}{
+		{"today", "2024-01-10", "2024-01-10"},
+		{"yesterday", "2024-01-09", "2024-01-09"},
+		{"this-week", "2024-01-08", "2024-01-14"},
+		{"last-week", "2024-01-01", "2024-01-07"},
+		{"this-month", "2024-01-01", "2024-01-31"},
+		{"last-month", "2023-12-01", "2023-12-31"},
+		{"this-quarter", "2024-01-01", "2024-03-31"},
+		{"last-quarter", "2023-10-01", "2023-12-31"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.period, func(t *testing.T) {
+			start, end, err := GetTimeRangeAt(tt.period, loc, now)
+			if err != nil {
+				t.Fatalf("GetTimeRangeAt(%q) error = %v", tt.period, err)
+			}
+			if start.Format(APIDatetimeFmt) != tt.wantStart+" 00:00:00" {
+				t.Errorf("GetTimeRangeAt(%q) start = %v, want %s", tt.period, start, tt.wantStart)
+			}
+			if end.Format(APIDatetimeFmt) != tt.wantEnd+" 23:59:59" {
+				t.Errorf("GetTimeRangeAt(%q) end = %v, want %s", tt.period, end, tt.wantEnd)
+			}
+		})
+	}
+}
+
+func TestDaysInMonth(t *testing.T) {
+	want := []int{31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31}
+	for month := 1; month <= 12; month++ {
+		if got := daysInMonth(2023, month); got != want[month-1] {
+			t.Errorf("daysInMonth(2023, %d) = %d, want %d", month, got, want[month-1])
+		}
+	}
+	for year, feb := range map[int]int{2024: 29, 1900: 28, 2000: 29} {
+		if got := daysInMonth(year, 2); got != feb {
+			t.Errorf("daysInMonth(%d, 2) = %d, want %d", year, got, feb)
+		}
+	}
+}
+
+func TestRelativeDelta(t *testing.T) {
+	tests := []struct {
+		day  string
+		unit byte
+		num  int
+		want string
+	}{
+		{"2024-07-15", 'd', 1, "2024-07-14"},
+		{"2024-03-01", 'd', 1, "2024-02-29"},
+		{"2024-01-03", 'w', 1, "2023-12-27"},
+		{"2024-07-15", 'd', 365, "2023-07-16"},
+		{"2024-07-15", 'm', 1, "2024-06-15"},
+		{"2024-01-15", 'm', 1, "2023-12-15"},
+		{"2024-03-31", 'm', 1, "2024-02-29"},
+		{"2024-05-31", 'm', 14, "2023-03-31"},
+		{"2023-11-30", 'm', -3, "2024-02-29"},
+		{"2024-02-29", 'y', 1, "2023-02-28"},
+	}
+
+	for _, tt := range tests {
+		t.Run(fmt.Sprintf("%s %c-%d", tt.day, tt.unit, tt.num), func(t *testing.T) {
+			day, _ := ParseDate(tt.day)
+			year, month, d := relativeDelta(tt.unit, tt.num, day.Year(), int(day.Month()), day.Day())
+			if got := fmt.Sprintf("%04d-%02d-%02d", year, month, d); got != tt.want {
+				t.Errorf("relativeDelta(%c, %d) from %s = %s, want %s", tt.unit, tt.num, tt.day, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestCivilDaysRoundTrip(t *testing.T) {
+	for _, dateStr := range []string{"1970-01-01", "1600-03-01", "2000-02-29", "2024-12-31"} {
+		day, _ := ParseDate(dateStr)
+		days := daysFromCivil(day.Year(), int(day.Month()), day.Day())
+		if want := int(day.Unix() / 86400); days != want {
+			t.Errorf("daysFromCivil(%s) = %d, want %d", dateStr, days, want)
+		}
+		year, month, d := civilFromDays(days)
+		if got := fmt.Sprintf("%04d-%02d-%02d", year, month, d); got != dateStr {
+			t.Errorf("civilFromDays(%d) = %s, want %s", days, got, dateStr)
+		}
+	}
+}
+
+func TestDayIndex(t *testing.T) {
+	// Late evening in New York is already the next day in UTC; the index
+	// follows the local calendar date
+	ny := GetTZ("America/New_York")
+	evening := time.Date(2024, 7, 15, 22, 0, 0, 0, ny)
+	idx := DayIndex(evening)
+	if got := DayFromIndex(idx).Format(APIDateFmt); got != "2024-07-15" {
+		t.Errorf("DayFromIndex(DayIndex(%v)) = %s, want 2024-07-15", evening, got)
+	}
+	if DayIndex(time.Unix(0, 0).UTC()) != 0 {
+		t.Errorf("Expected the Unix epoch to be day 0")
+	}
+}
+
+func TestMonthSpan(t *testing.T) {
+	start, end := monthSpan(2023, 10, 3, time.UTC)
+	if start.Format(APIDatetimeFmt) != "2023-10-01 00:00:00" || end.Format(APIDatetimeFmt) != "2023-12-31 23:59:59" {
+		t.Errorf("monthSpan(2023, 10, 3) = %v - %v", start, end)
+	}
+	start, end = monthSpan(2024, 2, 1, time.UTC)
+	if start.Format(APIDateFmt) != "2024-02-01" || end.Format(APIDateFmt) != "2024-02-29" {
+		t.Errorf("monthSpan(2024, 2, 1) = %v - %v", start, end)
+	}
+}
+
 func TestLogOverlapsRange(t *testing.T) {
 	loc := time.UTC
 	start := time.Date(2024, 7, 15, 10, 0, 0, 0, loc)
@@ -241,3 +405,19 @@ func TestGetTZ(t *testing.T) {
 	}
 }
 
+func TestGetTZCachesLookups(t *testing.T) {
+	first := GetTZ("America/Chicago")
+	if second := GetTZ("America/Chicago"); second != first {
+		t.Errorf("GetTZ returned a new location on the second lookup")
+	}
+
+	if loc := GetTZ("Not/A_Zone"); loc != time.UTC {
+		t.Errorf("GetTZ(%q) = %v, want UTC", "Not/A_Zone", loc)
+	}
+	tzCacheLock.RLock()
+	cached := tzCache["Not/A_Zone"]
+	tzCacheLock.RUnlock()
+	if cached != time.UTC {
+		t.Errorf("Expected failed lookup to be cached as UTC, got %v", cached)
+	}
+}
@@ -2,77 +2,111 @@
 package output
 
 import (
+	"bufio"
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
 )
 
+// outputBufferSize is the stdout buffer used by the JSON writers, so large
+// ranges are emitted in a few large writes rather than several per record.
+const outputBufferSize = 64 * 1024
+
+// jsonArrayWriter writes items to stdout as a compact JSON array. Every item
+// is encoded into the same scratch buffer by one Encoder, so the encoder and
+// its output buffer are set up once per array rather than once per item.
+type jsonArrayWriter struct {
+	w     *bufio.Writer
+	buf   bytes.Buffer
+	enc   *json.Encoder
+	count int
+}
+
+// newJSONArrayWriter starts a JSON array on stdout.
+func newJSONArrayWriter() *jsonArrayWriter {
+	a := &jsonArrayWriter{w: bufio.NewWriterSize(os.Stdout, outputBufferSize)}
+	a.enc = json.NewEncoder(&a.buf)
+	// Transcripts are full of <, > and &; emit them as-is like the Python
+	// CLI's encoder instead of spending bytes and time on \u003c escapes
+	a.enc.SetEscapeHTML(false)
+	a.w.WriteByte('[')
+	return a
+}
+
+// write appends item to the array, skipping items that cannot be encoded.
+func (a *jsonArrayWriter) write(item interface{}) {
+	a.buf.Reset()
+	if err := a.enc.Encode(item); err != nil {
+		return
+	}
+	if a.count > 0 {
+		a.w.WriteByte(',')
+	}
+	// Encode terminates each value with a newline; drop it to stay compact
+	a.w.Write(bytes.TrimSuffix(a.buf.Bytes(), []byte{'\n'}))
+	a.count++
+}
+
+// close ends the array and flushes it to stdout.
+func (a *jsonArrayWriter) close() {
+	a.w.WriteString("]\n")
+	a.w.Flush()
+}
+
 // StreamJSON writes an iterator of JSON-able maps as a compact JSON array.
 func StreamJSON(logs <-chan map[string]interface{}) {
-	fmt.Print("[")
-	first := true
+	a := newJSONArrayWriter()
 	for item := range logs {
-		if !first {
-			fmt.Print(",")
-		}
-		data, err := json.Marshal(item)
-		if err != nil {
-			continue
-		}
-		os.Stdout.Write(data)
-		first = false
+		a.write(item)
 	}
-	fmt.Println("]")
+	a.close()
 }
 
 // StreamJSONSlice writes a slice of maps as a compact JSON array.
 func StreamJSONSlice(logs []map[string]interface{}) {
-	fmt.Print("[")
-	for i, item := range logs {
-		if i > 0 {
-			fmt.Print(",")
-		}
-		data, err := json.Marshal(item)
-		if err != nil {
-			continue
-		}
-		os.Stdout.Write(data)
+	a := newJSONArrayWriter()
+	for _, item := range logs {
+		a.write(item)
 	}
-	fmt.Println("]")
+	a.close()
 }
 
 // PrintMarkdown extracts and prints the markdown field of each lifelog.
 func PrintMarkdown(logs <-chan map[string]interface{}) {
+	w := bufio.NewWriterSize(os.Stdout, outputBufferSize)
+	defer w.Flush()
+
 	for item := range logs {
-		md := ""
-		if m, ok := item["markdown"].(string); ok && m != "" {
-			md = m
-		} else if data, ok := item["data"].(map[string]interface{}); ok {
-			if m, ok := data["markdown"].(string); ok {
-				md = m
-			}
-		}
-		if md != "" {
-			fmt.Println(md)
-		}
+		writeMarkdown(w, item)
 	}
 }
 
 // PrintMarkdownSlice extracts and prints the markdown field from a slice.
 func PrintMarkdownSlice(logs []map[string]interface{}) {
+	w := bufio.NewWriterSize(os.Stdout, outputBufferSize)
+	defer w.Flush()
+
 	for _, item := range logs {
-		md := ""
-		if m, ok := item["markdown"].(string); ok && m != "" {
+		writeMarkdown(w, item)
+	}
+}
+
+// writeMarkdown writes the markdown of a lifelog followed by a newline,
+// preferring the top-level field over the one nested under "data".
+func writeMarkdown(w *bufio.Writer, item map[string]interface{}) {
+	md := ""
+	if m, ok := item["markdown"].(string); ok && m != "" {
+		md = m
+	} else if data, ok := item["data"].(map[string]interface{}); ok {
+		if m, ok := data["markdown"].(string); ok {
 			md = m
-		} else if data, ok := item["data"].(map[string]interface{}); ok {
-			if m, ok := data["markdown"].(string); ok {
-				md = m
-			}
-		}
-		if md != "" {
-			fmt.Println(md)
 		}
 	}
+	if md != "" {
+		w.WriteString(md)
+		w.WriteByte('\n')
+	}
 }
 
 // PrintJSON prints a single item as formatted JSON.
@@ -0,0 +1,168 @@
+package output
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"math"
+	"os"
+	"strings"
+	"testing"
+)
+
+// Tests in this package swap os.Stdout and so run sequentially.
+
+// captureStdout runs fn with os.Stdout redirected to a pipe and returns what
+// it wrote. The pipe is drained concurrently so large outputs cannot block.
+func captureStdout(t *testing.T, fn func()) string {
+	t.Helper()
+
+	r, w, err := os.Pipe()
+	if err != nil {
+		t.Fatalf("os.Pipe: %v", err)
+	}
+	original := os.Stdout
+	os.Stdout = w
+	defer func() { os.Stdout = original }()
+
+	done := make(chan string)
+	go func() {
+		out, _ := io.ReadAll(r)
+		done <- string(out)
+	}()
+
+	fn()
+
+	w.Close()
+	return <-done
+}
+
+// sendAll returns a closed channel holding logs, for the streaming writers.
+func sendAll(logs []map[string]interface{}) <-chan map[string]interface{} {
+	ch := make(chan map[string]interface{}, len(logs))
+	for _, log := range logs {
+		ch <- log
+	}
+	close(ch)
+	return ch
+}
+
+func TestStreamJSON(t *testing.T) {
+	cases := []struct {
+		name string
+		logs []map[string]interface{}
+		want string
+	}{
+		{"empty", nil, "[]\n"},
+		{"one log", []map[string]interface{}{{"id": "a"}}, `[{"id":"a"}]` + "\n"},
+		{
+			"several logs",
+			[]map[string]interface{}{{"id": "a", "n": 1}, {"id": "b"}, {"id": "c", "tags": []string{"x", "y"}}},
+			`[{"id":"a","n":1},{"id":"b"},{"id":"c","tags":["x","y"]}]` + "\n",
+		},
+		{
+			"html characters",
+			[]map[string]interface{}{{"markdown": "<b>Tom & Jerry</b> -> \"quoted\""}},
+			`[{"markdown":"<b>Tom & Jerry</b> -> \"quoted\""}]` + "\n",
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			writers := map[string]func(){
+				"StreamJSON":      func() { StreamJSON(sendAll(tc.logs)) },
+				"StreamJSONSlice": func() { StreamJSONSlice(tc.logs) },
+			}
+			for name, write := range writers {
+				out := captureStdout(t, write)
+				if out != tc.want {
+					t.Errorf("%s: expected %q, got %q", name, tc.want, out)
+				}
+
+				var decoded []map[string]interface{}
+				if err := json.Unmarshal([]byte(out), &decoded); err != nil {
+					t.Fatalf("%s: output does not round-trip: %v", name, err)
+				}
+				if len(decoded) != len(tc.logs) {
+					t.Errorf("%s: expected %d decoded logs, got %d", name, len(tc.logs), len(decoded))
+				}
+				for i, log := range decoded {
+					if log["id"] != tc.logs[i]["id"] || log["markdown"] != tc.logs[i]["markdown"] {
+						t.Errorf("%s: log %d decoded as %v", name, i, log)
+					}
+				}
+			}
+		})
+	}
+}
+
+func TestPrintMarkdown(t *testing.T) {
+	logs := []map[string]interface{}{
+		{"markdown": "# Morning"},
+		{"markdown": "", "data": map[string]interface{}{"markdown": "- nested <b>&</b>"}},
+		{"markdown": "# Evening, late"},
+	}
+	want := "# Morning\n- nested <b>&</b>\n# Evening, late\n"
+
+	// Everything must be on stdout once the call returns, before the pipe
+	// is closed, so these also check that the buffer is flushed on return
+	if out := captureStdout(t, func() { PrintMarkdown(sendAll(logs)) }); out != want {
+		t.Errorf("PrintMarkdown: expected %q, got %q", want, out)
+	}
+	if out := captureStdout(t, func() { PrintMarkdownSlice(logs) }); out != want {
+		t.Errorf("PrintMarkdownSlice: expected %q, got %q", want, out)
+	}
+}
+
+func TestPrintMarkdownLargerThanBuffer(t *testing.T) {
+	logs := make([]map[string]interface{}, 0, 2000)
+	var want strings.Builder
+	for i := 0; i < cap(logs); i++ {
+		md := fmt.Sprintf("## Entry %04d %s", i, strings.Repeat("x", 40))
+		logs = append(logs, map[string]interface{}{"markdown": md})
+		want.WriteString(md + "\n")
+	}
+	if want.Len() <= outputBufferSize {
+		t.Fatalf("Fixture of %d bytes does not exceed the %d byte buffer", want.Len(), outputBufferSize)
+	}
+
+	if out := captureStdout(t, func() { PrintMarkdownSlice(logs) }); out != want.String() {
+		t.Errorf("Expected %d bytes of markdown, got %d", want.Len(), len(out))
+	}
+}
+
+// TestOutputErrorPathsFlushFully drives the paths that skip an item, an
+// unencodable JSON value or a log without markdown, and checks that the rest
+// of the output is still written and flushed in full.
+func TestOutputErrorPathsFlushFully(t *testing.T) {
+	logs := make([]map[string]interface{}, 0, 1500)
+	var wantJSON, wantMarkdown strings.Builder
+	wantJSON.WriteByte('[')
+	for i := 0; i < cap(logs); i++ {
+		md := fmt.Sprintf("## Entry %04d %s", i, strings.Repeat("x", 40))
+		logs = append(logs, map[string]interface{}{"markdown": md})
+		if i > 0 {
+			wantJSON.WriteByte(',')
+		}
+		wantJSON.WriteString(`{"markdown":"` + md + `"}`)
+		wantMarkdown.WriteString(md + "\n")
+	}
+	wantJSON.WriteString("]\n")
+
+	// Unencodable items and logs without markdown, in the middle and last
+	bad := map[string]interface{}{"value": math.NaN()}
+	withBad := append([]map[string]interface{}{}, logs[:700]...)
+	withBad = append(withBad, bad)
+	withBad = append(withBad, logs[700:]...)
+	withBad = append(withBad, bad)
+
+	if out := captureStdout(t, func() { StreamJSON(sendAll(withBad)) }); out != wantJSON.String() {
+		t.Errorf("StreamJSON: expected %d bytes, got %d ending %q", wantJSON.Len(), len(out), out[max(0, len(out)-20):])
+	}
+	if out := captureStdout(t, func() { StreamJSONSlice(withBad) }); out != wantJSON.String() {
+		t.Errorf("StreamJSONSlice: expected %d bytes, got %d ending %q", wantJSON.Len(), len(out), out[max(0, len(out)-20):])
+	}
+	if out := captureStdout(t, func() { PrintMarkdown(sendAll(withBad)) }); out != wantMarkdown.String() {
+		t.Errorf("PrintMarkdown: expected %d bytes, got %d", wantMarkdown.Len(), len(out))
+	}
+}